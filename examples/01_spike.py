@@ -91,24 +91,23 @@ class SpikeApp(App):
     def on_mount(self):
         """Initialize on mount."""
         self.title = "VimTextArea Spike"
+        self._mode_display = self.query_one("#mode-display", Static)
+        self._output = self.query_one("#output", Static)
         self.query_one("#input").focus()
 
     def on_vim_text_area_mode_changed(self, event: VimTextArea.ModeChanged):
         """Update mode display when mode changes."""
-        mode_display = self.query_one("#mode-display")
-
         mode_text = {
             VimMode.INSERT: "[green]-- INSERT --[/green]",
             VimMode.COMMAND: "[blue]-- COMMAND --[/blue]",
             VimMode.VISUAL: "[yellow]-- VISUAL --[/yellow]",
         }.get(event.mode, "-- UNKNOWN --")
 
-        mode_display.update(mode_text)
+        self._mode_display.update(mode_text)
 
     def on_vim_text_area_submitted(self, event: VimTextArea.Submitted):
         """Handle text submission."""
-        output = self.query_one("#output")
-        output.update(
+        self._output.update(
             f"[bold cyan]Submitted:[/bold cyan]\n{event.text}\n\n"
             f"[dim]Text has {len(event.text)} characters, "
             f"{len(event.text.splitlines())} lines[/dim]"
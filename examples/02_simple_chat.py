@@ -9,6 +9,7 @@ A basic chat interface demonstrating:
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, RichLog
 from textual.containers import Vertical
+import re
 import sys
 import os
 
@@ -17,6 +18,18 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from vimkeys_input import VimTextArea
 
+# Canned replies keyed by the keyword that triggers them
+_RESPONSES = {
+    "hello": "Hello! How can I help you today?",
+    "hi": "Hello! How can I help you today?",
+    "how are you": "I'm doing great! Thanks for asking. How are you?",
+    "bye": "Goodbye! Have a great day!",
+    "goodbye": "Goodbye! Have a great day!",
+}
+
+# All keywords in one pattern, so a prompt is scanned once
+_BOT_PATTERN = re.compile(r"\b(hello|hi|how are you|bye|goodbye)\b", re.IGNORECASE)
+
 
 class SimpleChatApp(App):
     """Simple chat application."""
@@ -71,11 +84,13 @@ class SimpleChatApp(App):
     def on_mount(self):
         """Initialize on mount."""
         self.title = "Simple Chat with VimTextArea"
-        self.query_one("#input").focus()
+        self._history = self.query_one("#history", RichLog)
+        self._input = self.query_one("#input", VimTextArea)
+        self._input.focus()
         self.message_count = 0
 
         # Welcome message
-        history = self.query_one("#history")
+        history = self._history
         history.write("[bold cyan]Welcome to Simple Chat![/bold cyan]")
         history.write("Type your message and press Enter in insert mode to send.")
         history.write("Use vim keybindings for editing (ESC for command mode, i for insert).")
@@ -83,10 +98,10 @@ class SimpleChatApp(App):
 
     def on_vim_text_area_submitted(self, event: VimTextArea.Submitted):
         """Handle user message."""
-        history = self.query_one("#history")
+        history = self._history
 
         # Don't process empty messages
-        if not event.text.strip():
+        if not event.stripped_text:
             return
 
         self.message_count += 1
@@ -102,14 +117,9 @@ class SimpleChatApp(App):
     def get_bot_response(self, prompt: str) -> str:
         """Get bot response (simple echo bot for now)."""
         # Simple responses based on content
-        prompt_lower = prompt.lower()
-
-        if "hello" in prompt_lower or "hi" in prompt_lower:
-            return "Hello! How can I help you today?"
-        elif "how are you" in prompt_lower:
-            return "I'm doing great! Thanks for asking. How are you?"
-        elif "bye" in prompt_lower or "goodbye" in prompt_lower:
-            return "Goodbye! Have a great day!"
+        match = _BOT_PATTERN.search(prompt)
+        if match:
+            return _RESPONSES[match.group(1).lower()]
         elif "?" in prompt:
             return f"That's a great question about: '{prompt}'. Let me think about that..."
         else:
@@ -117,7 +127,7 @@ class SimpleChatApp(App):
 
     def action_clear_history(self):
         """Clear chat history."""
-        history = self.query_one("#history")
+        history = self._history
         history.clear()
         self.message_count = 0
         history.write("[dim]History cleared[/dim]")
@@ -10,12 +10,17 @@ Demonstrates:
 """
 
 from textual.app import App, ComposeResult
-from textual.widgets import Header, Footer, RichLog
+from textual.widgets import Header, Footer, RichLog, Static
 from textual.containers import Vertical
 from textual.command import Provider, Hit
+from textual.cache import LRUCache
 from textual import events
+from rich.text import Text
+from collections import deque
+from functools import partial
 import asyncio
 import sys
+import time
 import os
 
 # Add parent directory to path so we can import vimkeys_input
@@ -23,13 +28,75 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from vimkeys_input import VimTextArea
 
+# Keys that browse input history, and keys that don't end a browsing session
+_HISTORY_KEYS = frozenset({"up", "down"})
+_KEEP_BROWSING_KEYS = frozenset({"escape", "enter"})
+
+# Pre-styled pieces of chat history lines, so writes skip the markup parser
+USER_PREFIX = Text("You: ", style="bold cyan")
+AI_PREFIX = Text("AI: ", style="bold green")
+THINKING_FRAMES = tuple(
+    Text(f"AI is thinking{dots}", style="dim italic") for dots in ("", ".", "..", "...")
+)
+
+# Simulated response text around the quoted prompt
+_RESPONSE_HEAD = ("I understand you're asking about: ",)
+_RESPONSE_TAIL = (
+    "This is a simulated streaming response ",
+    "that demonstrates how tokens would appear ",
+    "one by one in a real AI conversation. ",
+    "Each word appears with a small delay ",
+    "to simulate the streaming behavior ",
+    "of large language models. ",
+    "Pretty cool, right?",
+)
+
+# The fixed parts of the response, pre-split into word tokens
+_HEAD_TOKENS = tuple(word + " " for chunk in _RESPONSE_HEAD for word in chunk.split())
+_TAIL_TOKENS = tuple(word + " " for chunk in _RESPONSE_TAIL for word in chunk.split())
+
+
+def _iter_tokens(prompt: str, batch: int):
+    """Yield the simulated response for prompt, batch words at a time."""
+    # Only the quoted prompt varies per call
+    prompt_tokens = tuple(word + " " for word in f'"{prompt}".'.split())
+    tokens = _HEAD_TOKENS + prompt_tokens + _TAIL_TOKENS
+    for i in range(0, len(tokens), batch):
+        yield "".join(tokens[i : i + batch])
+
+
+def _char_mask(text: str) -> int:
+    """Bitmask of the characters in text (lowercased, folded into 64 bits)."""
+    mask = 0
+    for char in text.lower():
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+# How each conversation role is labelled in the markdown export
+_EXPORT_ROLES = {"user": "**You**", "assistant": "**AI**"}
+
+
+def _write_conversation(filename: str, messages: list[dict]) -> None:
+    """Write messages to a markdown file, one message at a time."""
+    with open(filename, "w", buffering=1 << 16) as f:
+        f.write("# Conversation Export\n\n")
+        for msg in messages:
+            f.write(_EXPORT_ROLES.get(msg["role"], "**AI**"))
+            f.write(": ")
+            f.write(msg["content"])
+            f.write("\n\n")
+
 
 class HistoryVimTextArea(VimTextArea):
     """VimTextArea with input history navigation via up/down arrows."""
 
+    # Oldest inputs are forgotten beyond this many entries
+    MAX_HISTORY = 500
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.input_history = []  # List of previous inputs
+        self.input_history = deque(maxlen=self.MAX_HISTORY)  # Previous inputs
         self.history_index = -1  # Current position in history (-1 = not browsing)
         self.current_draft = ""  # Store current text when browsing history
 
@@ -41,41 +108,40 @@ class HistoryVimTextArea(VimTextArea):
 
     def on_key(self, event: events.Key) -> None:
         """Handle arrow key history navigation."""
+        key = event.key
+
         # Only handle up/down arrows
-        if event.key not in ("up", "down"):
+        if key not in _HISTORY_KEYS:
             # Reset history browsing if user types something else
-            if self.history_index != -1 and event.key not in ("escape", "enter"):
+            if self.history_index != -1 and key not in _KEEP_BROWSING_KEYS:
                 self.history_index = -1
             return super().on_key(event)
 
-        cursor_row, cursor_col = self.cursor_location
-
         # Up arrow: navigate to previous input
-        if event.key == "up":
+        if key == "up":
             # Only activate history if cursor is at first line, first column
-            if cursor_row == 0 and cursor_col == 0:
+            if self.cursor_location == (0, 0):
                 if not self.input_history:
                     return  # No history to navigate
 
-                # First time browsing: save current draft
                 if self.history_index == -1:
+                    # First time browsing: save current draft, load newest entry
                     self.current_draft = self.text
-
-                # Move to previous history entry
-                if self.history_index == -1:
                     self.history_index = len(self.input_history) - 1
-                elif self.history_index > 0:
-                    self.history_index -= 1
+                    self.text = self.input_history[-1]
+                else:
+                    # Move to previous history entry
+                    if self.history_index > 0:
+                        self.history_index -= 1
+                    self.text = self.input_history[self.history_index]
 
-                # Load history entry
-                self.text = self.input_history[self.history_index]
                 self.cursor_location = (0, 0)
                 event.prevent_default()
                 event.stop()
                 return
 
         # Down arrow: navigate to next input
-        elif event.key == "down":
+        elif key == "down":
             # Only if we're actively browsing history
             if self.history_index != -1:
                 if self.history_index < len(self.input_history) - 1:
@@ -98,25 +164,42 @@ class HistoryVimTextArea(VimTextArea):
 class ChatCommands(Provider):
     """Custom commands for chat app."""
 
+    # (command id, description) pairs offered in the palette
+    COMMANDS = (
+        ("clear", "Clear chat history"),
+        ("save", "Save conversation"),
+        ("new", "Start new conversation"),
+    )
+
+    # Highlighted command texts kept across keystrokes, keyed by (query, text)
+    HIGHLIGHT_CACHE_SIZE = 256
+
+    async def startup(self):
+        """Build the command callbacks once, before the first search."""
+        run_command = self.app.run_command
+        self._entries = tuple(
+            (text, _char_mask(text), partial(run_command, command_id))
+            for command_id, text in self.COMMANDS
+        )
+        self._highlights = LRUCache(self.HIGHLIGHT_CACHE_SIZE)
+
     async def search(self, query: str):
         """Search for commands."""
         matcher = self.matcher(query)
+        query_mask = _char_mask(query)
 
-        commands = [
-            ("clear", "Clear chat history"),
-            ("save", "Save conversation"),
-            ("new", "Start new conversation"),
-        ]
-
-        for command_id, text in commands:
+        for text, mask, callback in self._entries:
+            # A fuzzy match needs every query character, so skip texts missing any
+            if query_mask & ~mask:
+                continue
             score = matcher.match(text)
             if score > 0:
-                yield Hit(
-                    score,
-                    matcher.highlight(text),
-                    lambda c=command_id: self.app.run_command(c),
-                    help=text,
-                )
+                # Highlights are immutable Content, so they're safe to share between hits
+                key = (query, text)
+                display = self._highlights.get(key)
+                if display is None:
+                    display = self._highlights[key] = matcher.highlight(text)
+                yield Hit(score, display, callback, help=text)
 
 
 class StreamingChatApp(App):
@@ -135,6 +218,12 @@ class StreamingChatApp(App):
         padding: 1;
     }
 
+    #live {
+        display: none;
+        height: auto;
+        padding: 0 2;
+    }
+
     #input {
         height: auto;
         max-height: 10;
@@ -156,17 +245,41 @@ class StreamingChatApp(App):
 
     COMMANDS = {ChatCommands}
 
+    # Minimum time between history redraws while streaming (seconds)
+    RENDER_INTERVAL = 0.03
+
+    # Tokens buffered between the response stream and the renderer
+    TOKEN_QUEUE_SIZE = 64
+
+    # Simulated stream pacing: words sent per tick, and delay per word (seconds)
+    STREAM_BATCH = 2
+    STREAM_WORD_DELAY = 0.08
+
+    # Caps on what a long session keeps around (oldest entries are dropped)
+    MAX_DISPLAY_LINES = 2000
+    MAX_CONVERSATION = 1000
+
     def __init__(self):
         super().__init__()
         self.is_streaming = False
-        self.conversation = []
+        self.conversation = deque(maxlen=self.MAX_CONVERSATION)
         self.thinking_task = None
-        self.display_lines = []  # Track what's shown in history
+        self._thinking_visible = False  # Thinking line is shown in the live line
+        self._live_line = None  # Text shown in the live line
+        self._live_rows = 0  # Rows the live line wraps onto
 
     def compose(self) -> ComposeResult:
         yield Header()
         with Vertical():
-            yield RichLog(id="history", markup=True, auto_scroll=True, highlight=True, wrap=True)
+            yield RichLog(
+                id="history",
+                max_lines=self.MAX_DISPLAY_LINES,
+                auto_scroll=True,
+                wrap=True,
+            )
+            # The line still changing (thinking dots, streamed reply); the log
+            # itself is only ever appended to
+            yield Static(id="live")
             yield HistoryVimTextArea(id="input")
         yield Footer()
 
@@ -174,170 +287,234 @@ class StreamingChatApp(App):
         """Initialize."""
         self.title = "Streaming Chat"
         self.sub_title = ""
-        self.query_one("#input").focus()
+        self._history = self.query_one("#history", RichLog)
+        self._live = self.query_one("#live", Static)
+        self._input = self.query_one("#input", HistoryVimTextArea)
+        self._input.focus()
 
         # Add welcome messages
-        self.display_lines = [
-            "[bold cyan]Streaming Chat Application[/bold cyan]",
-            "Watch responses stream in token-by-token!",
-            "",
-        ]
-        self._refresh_history()
-
-    def _refresh_history(self):
-        """Refresh the history display."""
-        history = self.query_one("#history")
-        history.clear()
-        for line in self.display_lines:
-            history.write(line)
+        self._append_line(Text("Streaming Chat Application", style="bold cyan"))
+        self._append_line(Text("Watch responses stream in token-by-token!"))
+        self._append_line(Text())
+
+    def _append_line(self, line: Text):
+        """Append a single line to the history display."""
+        self._history.write(line)
+
+    def _show_live(self, line: Text):
+        """Show line in the live line below the history, replacing what was there."""
+        live = self._live
+        if live.display and line == self._live_line:
+            return
+        self._live_line = line
+
+        width = live.content_region.width
+        rows = len(line.wrap(self.console, width)) if width else 0
+        if live.display and rows == self._live_rows:
+            # Same height: repaint just the live line, the log's layout is unchanged
+            live.update(line, layout=False)
+            return
+
+        live.update(line)
+        # Rows the live line gains come out of the log, so keep its end in view;
+        # rewrites that don't add rows queue no scroll
+        added_rows = not live.display or rows > self._live_rows
+        live.display = True
+        self._live_rows = rows
+        if added_rows and self._history.auto_scroll:
+            self._history.scroll_end(animate=False, x_axis=False)
+
+    def _hide_live(self):
+        """Hide the live line."""
+        self._live.display = False
+        self._live_line = None
+        self._live_rows = 0
 
     async def animate_thinking_dots(self):
         """Animate the thinking indicator dots."""
         dots = 0
-        messages = [
-            "[dim italic]AI is thinking[/dim italic]",
-            "[dim italic]AI is thinking.[/dim italic]",
-            "[dim italic]AI is thinking..[/dim italic]",
-            "[dim italic]AI is thinking...[/dim italic]",
-        ]
 
         # Show initial message in display
-        self.display_lines.append(messages[0])
-        self._refresh_history()
+        self._show_live(THINKING_FRAMES[0])
+        self._thinking_visible = True
 
-        while self.is_streaming:
+        while True:
             await asyncio.sleep(0.5)  # Update every 500ms
-            dots = (dots + 1) % 4
-
-            # Update the last line with new animation frame
-            self.display_lines[-1] = messages[dots]
-            self._refresh_history()
+            if not self._thinking_visible:
+                return
+            dots = (dots + 1) % len(THINKING_FRAMES)
+
+            # Update the live line with new animation frame
+            self._show_live(THINKING_FRAMES[dots])
+
+    def _hide_thinking(self):
+        """Remove the thinking line if the animation has drawn it."""
+        if self._thinking_visible:
+            self._thinking_visible = False
+            self._hide_live()
+
+    async def _stop_thinking(self):
+        """Stop the thinking animation and remove its line (safe to call twice)."""
+        if self.thinking_task:
+            self.thinking_task.cancel()
+            try:
+                await self.thinking_task
+            except asyncio.CancelledError:
+                pass
+            self.thinking_task = None
+
+        # Remove thinking line (if the animation got to draw it)
+        self._hide_thinking()
 
     async def on_vim_text_area_submitted(self, event: VimTextArea.Submitted):
         """Handle user message with streaming."""
+        text = event.text
+        # Blank submissions are ignored outright, even mid-stream
+        if not event.stripped_text:
+            return
         if self.is_streaming:
             self.notify("Please wait for current response to complete", severity="warning")
             return
 
-        if not event.text.strip():
-            return
-
         # Add to input history
-        input_widget = self.query_one("#input", HistoryVimTextArea)
-        input_widget.add_to_history(event.text)
+        self._input.add_to_history(text)
 
         # Store user message
-        self.conversation.append({"role": "user", "content": event.text})
+        self.conversation.append({"role": "user", "content": text})
 
         # Add user message to display
-        self.display_lines.append(f"[bold cyan]You:[/bold cyan] {event.text}")
-        self._refresh_history()
+        self._append_line(USER_PREFIX + Text(text))
 
         # Show animated thinking indicator
         self.is_streaming = True
         self.thinking_task = asyncio.create_task(self.animate_thinking_dots())
 
+        # Stream tokens through a bounded queue so a slow render doesn't hold
+        # up the stream, and every token already queued lands in one render
+        queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=self.TOKEN_QUEUE_SIZE)
+        producer = asyncio.create_task(self._produce_tokens(text, queue))
+
         try:
-            full_response = ""
-            async for token in self.stream_ai_response(event.text):
-                # First token: stop thinking animation and start response line
-                if not full_response:
-                    # Stop thinking animation
-                    if self.thinking_task:
-                        self.thinking_task.cancel()
-                        try:
-                            await self.thinking_task
-                        except asyncio.CancelledError:
-                            pass
-
-                    # Remove thinking line and add AI response line
-                    self.display_lines = self.display_lines[:-1]  # Remove thinking line
-
-                # Accumulate response
-                full_response += token
-
-                # Update the last line with accumulated response (or add if first token)
-                if len(self.display_lines) == 0 or not self.display_lines[-1].startswith(
-                    "[bold green]AI:"
-                ):
-                    self.display_lines.append(f"[bold green]AI:[/bold green] {full_response}")
+            response_parts: list[str] = []
+            rendered_len = 0  # len(response_parts) at the last render
+            last_render = 0.0
+            finished = False
+            while not finished:
+                timeout = None
+                if rendered_len != len(response_parts):
+                    # Tokens are held back: show them once the interval is up,
+                    # even if no new token arrives by then
+                    timeout = max(0.0, last_render + self.RENDER_INTERVAL - time.monotonic())
+                try:
+                    batch = [await asyncio.wait_for(queue.get(), timeout)]
+                except TimeoutError:
+                    batch = []
                 else:
-                    self.display_lines[-1] = f"[bold green]AI:[/bold green] {full_response}"
+                    while not queue.empty():
+                        batch.append(queue.get_nowait())
+                    if batch[-1] is None:  # End of stream
+                        batch.pop()
+                        finished = True
+
+                if batch:
+                    # First token: stop thinking animation and start response line
+                    if not response_parts:
+                        await self._stop_thinking()
+
+                        # Start the AI line; later renders only replace it
+                        self._show_live(AI_PREFIX)
+
+                    # Accumulate response
+                    response_parts.extend(batch)
+
+                # The finished response goes straight to the log (below)
+                if finished or rendered_len == len(response_parts):
+                    continue
+
+                # Coalesce tokens that arrive faster than the render interval
+                now = time.monotonic()
+                if now - last_render < self.RENDER_INTERVAL:
+                    continue
+                last_render = now
+                rendered_len = len(response_parts)
+                self._show_live(AI_PREFIX + Text("".join(response_parts)))
+
+            # Re-raise any error from the stream
+            await producer
+            self.is_streaming = False
 
-                # Refresh to show new token
-                self._refresh_history()
-                await asyncio.sleep(0)  # Yield control
+            # A stream that sent no tokens never stopped the animation
+            await self._stop_thinking()
 
-            self.is_streaming = False
+            # The finished response moves from the live line into the log
+            full_response = "".join(response_parts)
+            if response_parts:
+                self._hide_live()
+                self._append_line(AI_PREFIX + Text(full_response))
 
             # Add spacing after response
-            self.display_lines.append("")
-            self._refresh_history()
+            self._append_line(Text())
 
             # Store AI response
             self.conversation.append({"role": "assistant", "content": full_response})
 
         except Exception:
             self.is_streaming = False
+            producer.cancel()
             if self.thinking_task:
                 self.thinking_task.cancel()
-            # Remove thinking line on error
-            if self.display_lines and "thinking" in self.display_lines[-1]:
-                self.display_lines = self.display_lines[:-1]
-            self._refresh_history()
+            # Remove thinking line on error, keeping any partial response
+            self._hide_thinking()
+            if response_parts:
+                self._hide_live()
+                self._append_line(AI_PREFIX + Text("".join(response_parts)))
             raise
 
+    async def _produce_tokens(self, prompt: str, queue: asyncio.Queue):
+        """Feed tokens from stream_ai_response into the queue, ending with None."""
+        try:
+            async for token in self.stream_ai_response(prompt):
+                await queue.put(token)
+        except Exception:
+            await queue.put(None)  # Wake the consumer so it can collect the error
+            raise
+        await queue.put(None)
+
     async def stream_ai_response(self, prompt: str):
         """Stream AI response token by token (simulated)."""
-        # Simulated streaming response
-        responses = [
-            "I understand you're asking about: ",
-            f'"{prompt}". ',
-            "This is a simulated streaming response ",
-            "that demonstrates how tokens would appear ",
-            "one by one in a real AI conversation. ",
-            "Each word appears with a small delay ",
-            "to simulate the streaming behavior ",
-            "of large language models. ",
-            "Pretty cool, right?",
-        ]
-
-        for chunk in responses:
-            # Split into words for more granular streaming
-            words = chunk.split()
-            for word in words:
-                yield word + " "
-                await asyncio.sleep(0.08)  # Simulate network delay
+        # Send a few words per tick rather than waking up for every word
+        delay = self.STREAM_WORD_DELAY * self.STREAM_BATCH
+        # Pace against a fixed schedule so time spent rendering doesn't add to the delay
+        deadline = time.monotonic() + delay
+        for token in _iter_tokens(prompt, self.STREAM_BATCH):
+            yield token
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)  # Simulate network delay
+            deadline += delay
 
     def action_clear_history(self):
         """Clear chat history."""
-        self.display_lines = []
-        self.conversation = []
-        self._refresh_history()
+        self._thinking_visible = False
+        self._hide_live()
+        self.conversation.clear()
+        # Nothing to redraw if the history is already empty
+        if self._history.lines:
+            self._history.clear()
         self.notify("History cleared")
 
-    def action_save_conversation(self):
+    async def action_save_conversation(self):
         """Save conversation to file."""
         if not self.conversation:
             self.notify("No conversation to save", severity="warning")
             return
 
-        # Create markdown export
-        lines = ["# Conversation Export\n\n"]
-        for msg in self.conversation:
-            role = "**You**" if msg["role"] == "user" else "**AI**"
-            lines.append(f"{role}: {msg['content']}\n\n")
-
-        content = "".join(lines)
-
         # Save to file
-        import datetime
-
-        filename = f"conversation_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        filename = f"conversation_{time.strftime('%Y%m%d_%H%M%S')}.md"
 
         try:
-            with open(filename, "w") as f:
-                f.write(content)
+            # Write from a snapshot on a worker thread so disk I/O doesn't block the UI
+            await asyncio.to_thread(_write_conversation, filename, list(self.conversation))
             self.notify(f"Saved to {filename}")
         except Exception as e:
             self.notify(f"Error saving: {e}", severity="error")
@@ -345,14 +522,14 @@ class StreamingChatApp(App):
     def action_new_conversation(self):
         """Start new conversation."""
         self.action_clear_history()
-        self.query_one("#input").clear()
+        self._input.clear()
 
-    def run_command(self, command_id: str):
+    async def run_command(self, command_id: str):
         """Execute command from command palette."""
         if command_id == "clear":
             self.action_clear_history()
         elif command_id == "save":
-            self.action_save_conversation()
+            await self.action_save_conversation()
         elif command_id == "new":
             self.action_new_conversation()
 
@@ -0,0 +1,44 @@
+"""Shared fixtures for VimTextArea tests."""
+
+import pytest
+from textual.widgets.text_area import Selection
+
+from vimkeys_input import VimMode, VimTextArea
+
+
+@pytest.fixture(scope="module")
+def shared_widget():
+    """A single VimTextArea reused by every test in a module."""
+    return VimTextArea()
+
+
+@pytest.fixture
+def widget(shared_widget):
+    """The module's VimTextArea, reset to the state of a freshly built widget."""
+    w = shared_widget
+    w.text = ""
+    w.selection = Selection()
+    w.vim_mode = VimMode.INSERT
+    w.visual_start = None
+    w.pending_command = None
+    w.last_f_search = None
+    w.last_search_word = None
+    w.yank_register = ""
+    w.count_handler.clear()
+    w.marks_manager.clear_all()
+    w.text_object_state = None
+    w.operator_pending.clear()
+    return w
+
+
+@pytest.fixture
+def make_widget(widget):
+    """Factory that loads text into the reset widget and places the cursor."""
+
+    def _make(text="", row=0, col=0, mode=VimMode.COMMAND):
+        widget.text = text
+        widget.vim_mode = mode
+        widget.cursor_location = (row, col)
+        return widget
+
+    return _make
@@ -1,38 +1,29 @@
 """Tests for vim editing operations."""
 
 import pytest
-from vimkeys_input import VimTextArea, VimMode
+from vimkeys_input import VimMode
 
 
 class TestCharacterOperations:
     """Test character-level editing operations."""
 
-    def test_delete_char(self):
+    def test_delete_char(self, make_widget):
         """Test x deletes character under cursor."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 1)  # On 'e'
+        widget = make_widget("hello", 0, 1)  # On 'e'
 
         widget.edit_delete_char()
         assert widget.text == "hllo"
 
-    def test_delete_char_back(self):
+    def test_delete_char_back(self, make_widget):
         """Test X deletes character before cursor."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 2)  # After 'e'
+        widget = make_widget("hello", 0, 2)  # After 'e'
 
         widget.edit_delete_char_back()
         assert widget.text == "hllo"
 
-    def test_replace_char(self):
+    def test_replace_char(self, make_widget):
         """Test r replaces character."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 1)  # On 'e'
+        widget = make_widget("hello", 0, 1)  # On 'e'
 
         widget.edit_replace_char("a")
         assert widget.text == "hallo"
@@ -41,43 +32,31 @@ class TestCharacterOperations:
 class TestLineOperations:
     """Test line-level editing operations."""
 
-    def test_delete_line(self):
+    def test_delete_line(self, make_widget):
         """Test dd deletes entire line."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (1, 0)  # On line2
+        widget = make_widget("line1\nline2\nline3", 1, 0)  # On line2
 
         widget.edit_delete_line()
         # Line should be deleted
-        assert "line2" not in widget.text
+        assert widget.text.splitlines() == ["line1", "line3"]
 
-    def test_yank_line(self):
+    def test_yank_line(self, make_widget):
         """Test yy yanks line to register."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello world")
 
         widget.edit_yank_line()
         assert widget.yank_register == "hello world"
 
-    def test_delete_to_line_end(self):
+    def test_delete_to_line_end(self, make_widget):
         """Test D deletes to end of line."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 6)  # After "hello "
+        widget = make_widget("hello world", 0, 6)  # After "hello "
 
         widget.edit_delete_to_line_end()
         assert widget.yank_register == "world"
 
-    def test_change_line(self):
+    def test_change_line(self, make_widget):
         """Test cc deletes line and enters insert mode."""
-        widget = VimTextArea()
-        widget.text = "hello\nworld"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello\nworld")
 
         widget.edit_change_line()
         assert widget.vim_mode == VimMode.INSERT
@@ -86,33 +65,25 @@ class TestLineOperations:
 class TestPasteOperations:
     """Test paste operations."""
 
-    def test_paste_after_char(self):
+    def test_paste_after_char(self, make_widget):
         """Test p pastes after cursor."""
-        widget = VimTextArea()
-        widget.text = "helo"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 2)  # After 'e'
+        widget = make_widget("helo", 0, 2)  # After 'e'
         widget.yank_register = "l"
 
         widget.edit_paste_after()
         assert "hell" in widget.text
 
-    def test_paste_before(self):
+    def test_paste_before(self, make_widget):
         """Test P pastes before cursor."""
-        widget = VimTextArea()
-        widget.text = "helo"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 3)  # On 'o'
+        widget = make_widget("helo", 0, 3)  # On 'o'
         widget.yank_register = "l"
 
         widget.edit_paste_before()
         assert "hel" in widget.text
 
-    def test_paste_empty_register(self):
+    def test_paste_empty_register(self, make_widget):
         """Test paste with empty register does nothing."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("hello")
         widget.yank_register = ""
 
         original = widget.text
@@ -123,23 +94,17 @@ class TestPasteOperations:
 class TestOpenLineOperations:
     """Test opening new lines."""
 
-    def test_open_line_below(self):
+    def test_open_line_below(self, make_widget):
         """Test o opens line below."""
-        widget = VimTextArea()
-        widget.text = "line1"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("line1")
 
         widget.edit_open_line_below()
         # Should have newline added
         assert "\n" in widget.text
 
-    def test_open_line_above(self):
+    def test_open_line_above(self, make_widget):
         """Test O opens line above."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (1, 0)  # On line2
+        widget = make_widget("line1\nline2", 1, 0)  # On line2
 
         widget.edit_open_line_above()
         # Should have newline added
@@ -149,23 +114,17 @@ class TestOpenLineOperations:
 class TestWordOperations:
     """Test word-level operations."""
 
-    def test_delete_word(self):
+    def test_delete_word(self, make_widget):
         """Test dw deletes word."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello world")
 
         widget.edit_delete_word()
-        # Should have deleted some text
-        assert len(widget.text) < len("hello world")
+        # Should have deleted the first word
+        assert widget.text.split() == ["world"]
 
-    def test_change_word(self):
+    def test_change_word(self, make_widget):
         """Test cw changes word and enters insert mode."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello world")
 
         widget.edit_change_word()
         assert widget.vim_mode == VimMode.INSERT
@@ -174,22 +133,18 @@ class TestWordOperations:
 class TestUndoRedo:
     """Test undo/redo operations."""
 
-    def test_undo(self):
+    def test_undo(self, make_widget):
         """Test u triggers undo."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("hello")
 
         # Make a change
         widget.edit_delete_char()
         # Undo should be called (testing the method exists)
         widget.edit_undo()
 
-    def test_redo(self):
+    def test_redo(self, make_widget):
         """Test Ctrl+r triggers redo."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("hello")
 
         # Make a change, undo it, then redo
         widget.edit_delete_char()
@@ -200,23 +155,17 @@ class TestUndoRedo:
 class TestJoinLines:
     """Test line joining."""
 
-    def test_join_lines(self):
+    def test_join_lines(self, make_widget):
         """Test J joins current line with next."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("line1\nline2")
 
         widget.edit_join_lines()
         # Should have one less newline
-        assert widget.text.count("\n") < 1
+        assert widget.text.count("\n") == 0
 
-    def test_join_lines_last_line(self):
+    def test_join_lines_last_line(self, make_widget):
         """Test J on last line does nothing."""
-        widget = VimTextArea()
-        widget.text = "only line"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("only line")
 
         widget.edit_join_lines()
         # Should not crash
@@ -225,20 +174,16 @@ class TestJoinLines:
 class TestIndent:
     """Test indent/dedent operations."""
 
-    def test_indent(self):
+    def test_indent(self, make_widget):
         """Test >> indents line."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("hello")
 
         # Should not crash (actual indent behavior depends on TextArea)
         widget.edit_indent()
 
-    def test_dedent(self):
+    def test_dedent(self, make_widget):
         """Test << dedents line."""
-        widget = VimTextArea()
-        widget.text = "    hello"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("    hello")
 
         # Should not crash
         widget.edit_dedent()
@@ -247,37 +192,40 @@ class TestIndent:
 class TestEdgeCases:
     """Test edge cases for editing operations."""
 
-    def test_delete_on_empty_text(self):
+    def test_delete_on_empty_text(self, make_widget):
         """Test delete operations on empty text."""
-        widget = VimTextArea()
-        widget.text = ""
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("")
 
         # Should not crash
         widget.edit_delete_char()
         widget.edit_delete_line()
 
-    def test_yank_empty_line(self):
+    def test_yank_empty_line(self, make_widget):
         """Test yanking empty line."""
-        widget = VimTextArea()
-        widget.text = "\n"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("\n")
 
         widget.edit_yank_line()
         # Should have yanked empty string or newline
         assert isinstance(widget.yank_register, str)
 
-    def test_paste_with_line(self):
+    def test_paste_with_line(self, make_widget):
         """Test paste with full line (has newline)."""
-        widget = VimTextArea()
-        widget.text = "line1"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("line1")
         widget.yank_register = "line2\n"
 
         widget.edit_paste_after()
         # Should paste line
-        assert "line2" in widget.text
+        assert widget.text.splitlines() == ["line1", "line2"]
+        assert widget.cursor_location == (1, 0)
+
+    def test_paste_line_before_indented_line(self, make_widget):
+        """Test P pastes a full line above, not at the indent."""
+        widget = make_widget("line1\n  line3", 1, 3)
+        widget.yank_register = "line2\n"
+
+        widget.edit_paste_before()
+        assert widget.text.splitlines() == ["line1", "line2", "  line3"]
+        assert widget.cursor_location == (1, 0)
 
 
 if __name__ == "__main__":
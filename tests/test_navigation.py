@@ -1,86 +1,52 @@
 """Tests for vim navigation operations."""
 
 import pytest
-from vimkeys_input import VimTextArea, VimMode
 
 
 class TestBasicNavigation:
     """Test basic cursor movement (hjkl)."""
 
-    def test_nav_left(self):
-        """Test h key moves left."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 5)
+    @pytest.mark.parametrize(
+        "motion, text, start, expected",
+        [
+            ("nav_left", "hello world", (0, 5), (0, 4)),  # h
+            ("nav_right", "hello world", (0, 5), (0, 6)),  # l
+            ("nav_down", "line1\nline2\nline3", (0, 0), (1, 0)),  # j
+            ("nav_up", "line1\nline2\nline3", (1, 0), (0, 0)),  # k
+        ],
+    )
+    def test_basic_motion(self, make_widget, motion, text, start, expected):
+        """Test hjkl move the cursor one step."""
+        widget = make_widget(text, *start)
 
-        widget.nav_left()
-        assert widget.cursor_location == (0, 4)
-
-    def test_nav_right(self):
-        """Test l key moves right."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 5)
-
-        widget.nav_right()
-        assert widget.cursor_location == (0, 6)
-
-    def test_nav_down(self):
-        """Test j key moves down."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        widget.nav_down()
-        assert widget.cursor_location[0] == 1
-
-    def test_nav_up(self):
-        """Test k key moves up."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (1, 0)
-
-        widget.nav_up()
-        assert widget.cursor_location[0] == 0
+        getattr(widget, motion)()
+        assert widget.cursor_location == expected
 
 
 class TestWordNavigation:
     """Test word motion commands (w, b, e)."""
 
-    def test_nav_word_forward(self):
+    def test_nav_word_forward(self, make_widget):
         """Test w moves to next word."""
-        widget = VimTextArea()
-        widget.text = "hello world foo bar"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello world foo bar")
 
         widget.nav_word_forward()
         # Should move to start of "world"
         row, col = widget.cursor_location
         assert col > 0  # Moved forward
 
-    def test_nav_word_backward(self):
+    def test_nav_word_backward(self, make_widget):
         """Test b moves to previous word."""
-        widget = VimTextArea()
-        widget.text = "hello world foo bar"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 12)  # On "foo"
+        widget = make_widget("hello world foo bar", 0, 12)  # On "foo"
 
         widget.nav_word_backward()
         # Should move to start of "world"
         row, col = widget.cursor_location
         assert col < 12  # Moved backward
 
-    def test_nav_word_end(self):
+    def test_nav_word_end(self, make_widget):
         """Test e moves to end of word."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello world")
 
         widget.nav_word_end()
         # Should move toward end of word
@@ -91,77 +57,43 @@ class TestWordNavigation:
 class TestLineNavigation:
     """Test line movement commands (0, $, ^)."""
 
-    def test_nav_line_start(self):
-        """Test 0 moves to start of line."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 5)
-
-        widget.nav_line_start()
-        assert widget.cursor_location == (0, 0)
-
-    def test_nav_line_end(self):
-        """Test $ moves to end of line."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        widget.nav_line_end()
-        row, col = widget.cursor_location
-        assert col == len("hello world")
-
-    def test_nav_first_non_whitespace(self):
-        """Test ^ moves to first non-whitespace character."""
-        widget = VimTextArea()
-        widget.text = "   hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+    @pytest.mark.parametrize(
+        "motion, text, start, expected",
+        [
+            ("nav_line_start", "hello world", (0, 5), (0, 0)),  # 0
+            ("nav_line_end", "hello world", (0, 0), (0, len("hello world"))),  # $
+            ("nav_first_non_whitespace", "   hello world", (0, 0), (0, 3)),  # ^ to "hello"
+            ("nav_first_non_whitespace", "     ", (0, 3), (0, 0)),  # ^ on blank line
+        ],
+    )
+    def test_line_motion(self, make_widget, motion, text, start, expected):
+        """Test line motions land on the right column."""
+        widget = make_widget(text, *start)
 
-        widget.nav_first_non_whitespace()
-        assert widget.cursor_location == (0, 3)  # Start of "hello"
-
-    def test_nav_first_non_whitespace_all_whitespace(self):
-        """Test ^ on line with only whitespace."""
-        widget = VimTextArea()
-        widget.text = "     "
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 3)
-
-        widget.nav_first_non_whitespace()
-        assert widget.cursor_location == (0, 0)  # Line start
+        getattr(widget, motion)()
+        assert widget.cursor_location == expected
 
 
 class TestDocumentNavigation:
     """Test document movement commands (gg, G)."""
 
-    def test_nav_document_start(self):
-        """Test gg moves to start of document."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (2, 5)
-
-        widget.nav_document_start()
-        assert widget.cursor_location == (0, 0)
-
-    def test_nav_document_end(self):
-        """Test G moves to end of document."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        widget.nav_document_end()
-        row, col = widget.cursor_location
-        assert row == 2  # Last line
-
-    def test_nav_document_end_empty(self):
+    @pytest.mark.parametrize(
+        "motion, start, expected",
+        [
+            ("nav_document_start", (2, 5), (0, 0)),  # gg
+            ("nav_document_end", (0, 0), (2, 0)),  # G to last line
+        ],
+    )
+    def test_document_motion(self, make_widget, motion, start, expected):
+        """Test gg/G jump to the first/last line."""
+        widget = make_widget("line1\nline2\nline3", *start)
+
+        getattr(widget, motion)()
+        assert widget.cursor_location == expected
+
+    def test_nav_document_end_empty(self, make_widget):
         """Test G on empty document."""
-        widget = VimTextArea()
-        widget.text = ""
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("")
 
         widget.nav_document_end()
         # Should not crash
@@ -170,24 +102,18 @@ class TestDocumentNavigation:
 class TestParagraphNavigation:
     """Test paragraph movement ({ and })."""
 
-    def test_nav_paragraph_forward(self):
+    def test_nav_paragraph_forward(self, make_widget):
         """Test } moves to next paragraph."""
-        widget = VimTextArea()
-        widget.text = "para1\npara1\n\npara2\npara2"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("para1\npara1\n\npara2\npara2")
 
         widget.nav_paragraph_forward()
         row, col = widget.cursor_location
         # Should move to blank line or next paragraph
         assert row > 0
 
-    def test_nav_paragraph_backward(self):
+    def test_nav_paragraph_backward(self, make_widget):
         """Test { moves to previous paragraph."""
-        widget = VimTextArea()
-        widget.text = "para1\npara1\n\npara2\npara2"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (4, 0)  # Last line
+        widget = make_widget("para1\npara1\n\npara2\npara2", 4, 0)  # Last line
 
         widget.nav_paragraph_backward()
         row, col = widget.cursor_location
@@ -198,30 +124,24 @@ class TestParagraphNavigation:
 class TestGotoLine:
     """Test goto line functionality."""
 
-    def test_nav_goto_line_valid(self):
+    def test_nav_goto_line_valid(self, make_widget):
         """Test going to valid line number."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3\nline4\nline5"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("line1\nline2\nline3\nline4\nline5")
 
         widget.nav_goto_line(3)  # 1-indexed
         assert widget.cursor_location[0] == 2  # 0-indexed
 
-    def test_nav_goto_line_too_high(self):
+    def test_nav_goto_line_too_high(self, make_widget):
         """Test going to line number beyond document."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("line1\nline2\nline3")
 
         widget.nav_goto_line(100)
         row, col = widget.cursor_location
         assert row == 2  # Last line (clamped)
 
-    def test_nav_goto_line_zero(self):
+    def test_nav_goto_line_zero(self, make_widget):
         """Test going to line 0 or negative."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("line1\nline2\nline3")
 
         widget.nav_goto_line(0)
         assert widget.cursor_location[0] == 0  # First line
@@ -230,36 +150,25 @@ class TestGotoLine:
 class TestEdgeCases:
     """Test navigation edge cases."""
 
-    def test_nav_left_at_line_start(self):
-        """Test h at start of line."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        widget.nav_left()
-        # Should stay at start or move to previous line (TextArea behavior)
-        row, col = widget.cursor_location
-        assert row >= 0 and col >= 0
-
-    def test_nav_right_at_line_end(self):
-        """Test l at end of line."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 5)
-
-        widget.nav_right()
-        # Should stay at end or move to next line (TextArea behavior)
+    @pytest.mark.parametrize(
+        "motion, start",
+        [
+            ("nav_left", (0, 0)),  # h at start of line
+            ("nav_right", (0, 5)),  # l at end of line
+        ],
+    )
+    def test_nav_past_line_edge(self, make_widget, motion, start):
+        """Test h/l at the line edges stay in the document."""
+        widget = make_widget("hello", *start)
+
+        getattr(widget, motion)()
+        # Should stay put or wrap to a neighbouring line (TextArea behavior)
         row, col = widget.cursor_location
         assert row >= 0 and col >= 0
 
-    def test_nav_on_empty_line(self):
+    def test_nav_on_empty_line(self, make_widget):
         """Test navigation on empty line."""
-        widget = VimTextArea()
-        widget.text = "\n"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("\n")
 
         # Should not crash
         widget.nav_right()
@@ -267,12 +176,9 @@ class TestEdgeCases:
         widget.nav_line_start()
         widget.nav_line_end()
 
-    def test_nav_on_single_char_line(self):
+    def test_nav_on_single_char_line(self, make_widget):
         """Test navigation on single character line."""
-        widget = VimTextArea()
-        widget.text = "x"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("x")
 
         widget.nav_line_end()
         row, col = widget.cursor_location
@@ -1,50 +1,51 @@
 """Tests for character and word search operations."""
 
 import pytest
-from vimkeys_input import VimTextArea, VimMode
 
 
-class TestCharacterSearchForward:
-    """Test f (find character forward)."""
-
-    def test_search_char_forward_found(self):
-        """Test f finds character."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        result = widget.search_char_forward("o")
-        assert result is True
-        row, col = widget.cursor_location
-        assert col > 0  # Moved to 'o'
-
-    def test_search_char_forward_not_found(self):
-        """Test f returns False if not found."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        result = widget.search_char_forward("z")
-        assert result is False
-
-    def test_search_char_forward_stores_last_search(self):
-        """Test f stores search for repeat."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        widget.search_char_forward("o")
-        assert widget.last_f_search == ("f", "o")
-
-    def test_search_char_forward_same_char(self):
+class TestCharacterSearch:
+    """Test f/F (find character) and t/T (till character)."""
+
+    @pytest.mark.parametrize(
+        "method, char, start, expected, cursor",
+        [
+            ("search_char_forward", "o", (0, 0), True, (0, 4)),  # f lands on 'o'
+            ("search_char_backward", "o", (0, 10), True, (0, 7)),  # F lands on 'o'
+            ("search_till_forward", "o", (0, 0), True, (0, 3)),  # t stops before 'o'
+            ("search_till_backward", "o", (0, 10), True, (0, 8)),  # T stops after 'o'
+            ("search_char_forward", "z", (0, 0), False, (0, 0)),
+            ("search_char_backward", "z", (0, 5), False, (0, 5)),
+            ("search_till_forward", "z", (0, 0), False, (0, 0)),
+            ("search_till_backward", "z", (0, 10), False, (0, 10)),
+        ],
+    )
+    def test_char_search(self, make_widget, method, char, start, expected, cursor):
+        """Test f/F/t/T report whether the character was found and move the cursor."""
+        widget = make_widget("hello world", *start)
+
+        result = getattr(widget, method)(char)
+        assert result is expected
+        assert widget.cursor_location == cursor
+
+    @pytest.mark.parametrize(
+        "method, start, expected",
+        [
+            ("search_char_forward", (0, 0), ("f", "o")),
+            ("search_char_backward", (0, 10), ("F", "o")),
+            ("search_till_forward", (0, 0), ("t", "o")),
+            ("search_till_backward", (0, 10), ("T", "o")),
+        ],
+    )
+    def test_char_search_stores_last_search(self, make_widget, method, start, expected):
+        """Test f/F/t/T store the search for repeat."""
+        widget = make_widget("hello world", *start)
+
+        getattr(widget, method)("o")
+        assert widget.last_f_search == expected
+
+    def test_search_char_forward_same_char(self, make_widget):
         """Test f finds next occurrence of same char."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello")
 
         # Find first 'l'
         widget.search_char_forward("l")
@@ -57,110 +58,12 @@ class TestCharacterSearchForward:
         assert pos2[1] > pos1[1]  # Moved further
 
 
-class TestCharacterSearchBackward:
-    """Test F (find character backward)."""
-
-    def test_search_char_backward_found(self):
-        """Test F finds character backward."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 10)
-
-        result = widget.search_char_backward("o")
-        assert result is True
-        row, col = widget.cursor_location
-        assert col < 10  # Moved backward
-
-    def test_search_char_backward_not_found(self):
-        """Test F returns False if not found."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 5)
-
-        result = widget.search_char_backward("z")
-        assert result is False
-
-    def test_search_char_backward_stores_last_search(self):
-        """Test F stores search for repeat."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 10)
-
-        widget.search_char_backward("o")
-        assert widget.last_f_search == ("F", "o")
-
-
-class TestTillForward:
-    """Test t (till character forward)."""
-
-    def test_search_till_forward_found(self):
-        """Test t stops before character."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        result = widget.search_till_forward("o")
-        assert result is True
-        # Should be one before the 'o'
-
-    def test_search_till_forward_not_found(self):
-        """Test t returns False if not found."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        result = widget.search_till_forward("z")
-        assert result is False
-
-    def test_search_till_forward_stores_last_search(self):
-        """Test t stores search for repeat."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
-
-        widget.search_till_forward("o")
-        assert widget.last_f_search == ("t", "o")
-
-
-class TestTillBackward:
-    """Test T (till character backward)."""
-
-    def test_search_till_backward_found(self):
-        """Test T stops after character."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 10)
-
-        result = widget.search_till_backward("o")
-        assert result is True
-
-    def test_search_till_backward_not_found(self):
-        """Test T returns False if not found."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 10)
-
-        result = widget.search_till_backward("z")
-        assert result is False
-
-
 class TestSearchRepeat:
     """Test ; (repeat search) and , (reverse repeat)."""
 
-    def test_search_repeat_forward(self):
+    def test_search_repeat_forward(self, make_widget):
         """Test ; repeats last f search."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello world")
 
         # Do initial search
         widget.search_char_forward("l")
@@ -174,22 +77,17 @@ class TestSearchRepeat:
         if result:
             assert pos2[1] >= pos1[1]
 
-    def test_search_repeat_no_previous(self):
+    def test_search_repeat_no_previous(self, make_widget):
         """Test ; with no previous search."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("hello world")
         widget.last_f_search = None
 
         result = widget.search_repeat()
         assert result is False
 
-    def test_search_repeat_reverse(self):
+    def test_search_repeat_reverse(self, make_widget):
         """Test , reverses search direction."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 5)
+        widget = make_widget("hello world", 0, 5)
 
         # Search forward
         widget.search_char_forward("o")
@@ -197,11 +95,9 @@ class TestSearchRepeat:
         # Reverse repeat should search backward
         widget.search_repeat_reverse()
 
-    def test_search_repeat_reverse_no_previous(self):
+    def test_search_repeat_reverse_no_previous(self, make_widget):
         """Test , with no previous search."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("hello world")
         widget.last_f_search = None
 
         result = widget.search_repeat_reverse()
@@ -211,42 +107,30 @@ class TestSearchRepeat:
 class TestWordSearch:
     """Test * and # (word search)."""
 
-    def test_search_word_under_cursor_forward(self):
+    def test_search_word_under_cursor_forward(self, make_widget):
         """Test * searches for word under cursor."""
-        widget = VimTextArea()
-        widget.text = "hello world hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)  # On "hello"
+        widget = make_widget("hello world hello")  # On "hello"
 
         widget.search_word_under_cursor(forward=True)
         # Should find next occurrence or return bool
 
-    def test_search_word_under_cursor_backward(self):
+    def test_search_word_under_cursor_backward(self, make_widget):
         """Test # searches backward for word."""
-        widget = VimTextArea()
-        widget.text = "hello world hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 12)  # On second "hello"
+        widget = make_widget("hello world hello", 0, 12)  # On second "hello"
 
         widget.search_word_under_cursor(forward=False)
         # Should find previous occurrence
 
-    def test_search_word_under_cursor_not_on_word(self):
+    def test_search_word_under_cursor_not_on_word(self, make_widget):
         """Test * on non-word character."""
-        widget = VimTextArea()
-        widget.text = "hello   world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 5)  # On space
+        widget = make_widget("hello   world", 0, 5)  # On space
 
         result = widget.search_word_under_cursor(forward=True)
         assert result is False
 
-    def test_search_word_stores_word(self):
+    def test_search_word_stores_word(self, make_widget):
         """Test * stores word for repeat."""
-        widget = VimTextArea()
-        widget.text = "hello world hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello world hello")
 
         widget.search_word_under_cursor(forward=True)
         # Should have stored the word
@@ -257,77 +141,72 @@ class TestWordSearch:
 class TestSearchMultiline:
     """Test search across multiple lines."""
 
-    def test_search_char_only_current_line(self):
+    def test_search_char_only_current_line(self, make_widget):
         """Test f only searches current line."""
-        widget = VimTextArea()
-        widget.text = "hello\nworld"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello\nworld")
 
         # Try to find 'w' which is on next line
         result = widget.search_char_forward("w")
         assert result is False  # Should not find it
 
-    def test_search_word_multiline_forward(self):
+    def test_search_word_multiline_forward(self, make_widget):
         """Test * can find word on next line."""
-        widget = VimTextArea()
-        widget.text = "hello\nworld\nhello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello\nworld\nhello")
 
-        widget.search_word_under_cursor(forward=True)
+        assert widget.search_word_under_cursor(forward=True) is True
         # Should find "hello" on line 3
+        assert widget.cursor_location == (2, 0)
 
-    def test_search_word_multiline_backward(self):
+    def test_search_word_multiline_backward(self, make_widget):
         """Test # can find word on previous line."""
-        widget = VimTextArea()
-        widget.text = "hello\nworld\nhello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (2, 0)  # On second "hello"
+        widget = make_widget("hello\nworld\nhello", 2, 0)  # On second "hello"
 
-        widget.search_word_under_cursor(forward=False)
+        assert widget.search_word_under_cursor(forward=False) is True
         # Should find first "hello"
+        assert widget.cursor_location == (0, 0)
+
+    def test_search_word_wraps_to_beginning(self, make_widget):
+        """Test * wraps around to earlier lines."""
+        widget = make_widget("say hello\nworld\nhello", 2, 0)
+
+        assert widget.search_word_under_cursor(forward=True) is True
+        assert widget.cursor_location == (0, 4)
+
+    def test_search_word_wraps_to_end(self, make_widget):
+        """Test # wraps around to later lines."""
+        widget = make_widget("hello\nworld\nsay hello", 0, 0)
+
+        assert widget.search_word_under_cursor(forward=False) is True
+        assert widget.cursor_location == (2, 4)
 
 
 class TestSearchEdgeCases:
     """Test edge cases in search operations."""
 
-    def test_search_at_line_start(self):
+    def test_search_at_line_start(self, make_widget):
         """Test f from start of line."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello")
 
         widget.search_char_forward("h")
         # Should not find 'h' (cursor is already on it)
 
-    def test_search_at_line_end(self):
+    def test_search_at_line_end(self, make_widget):
         """Test F from end of line."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 5)
+        widget = make_widget("hello", 0, 5)
 
         result = widget.search_char_backward("o")
         assert result is True
 
-    def test_search_empty_line(self):
+    def test_search_empty_line(self, make_widget):
         """Test search on empty line."""
-        widget = VimTextArea()
-        widget.text = "\n"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("\n")
 
         result = widget.search_char_forward("a")
         assert result is False
 
-    def test_search_single_char_line(self):
+    def test_search_single_char_line(self, make_widget):
         """Test search on single character line."""
-        widget = VimTextArea()
-        widget.text = "x"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 0)
+        widget = make_widget("x")
 
         result = widget.search_char_forward("y")
         assert result is False
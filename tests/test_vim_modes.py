@@ -1,9 +1,20 @@
 """Basic tests for VimTextArea widget."""
 
 import pytest
+from textual.events import Key
+from textual.widgets.text_area import Selection
+
 from vimkeys_input import VimTextArea, VimMode
 
 
+def press(widget, *keys):
+    """Route key events through the widget's vim key handler."""
+    for key in keys:
+        event = Key(key, key if len(key) == 1 else None)
+        widget.on_key(event)
+    return event
+
+
 def test_vim_mode_enum():
     """Test VimMode enum exists and has expected values."""
     assert VimMode.INSERT
@@ -66,5 +77,149 @@ def test_mode_transitions():
     assert widget.vim_mode == VimMode.INSERT
 
 
+def test_mode_css_class():
+    """Test exactly the current mode's CSS class is applied."""
+    widget = VimTextArea()
+    assert widget.has_class("insert-mode")
+
+    widget._enter_command_mode()
+    widget._enter_command_mode()
+    assert widget.has_class("command-mode")
+    assert not widget.has_class("insert-mode")
+
+    widget._enter_visual_mode()
+    assert widget.has_class("visual-mode")
+    assert not widget.has_class("command-mode")
+
+
+class TestCommandKeys:
+    """Test command-mode key dispatch."""
+
+    def test_motion_key(self, make_widget):
+        """Test a motion key moves the cursor and is consumed."""
+        widget = make_widget("hello world")
+        event = press(widget, "l")
+        assert widget.cursor_location == (0, 1)
+        assert event._no_default_action
+
+    def test_counted_motion(self, make_widget):
+        """Test a count repeats the motion and is then cleared."""
+        widget = make_widget("line1\nline2\nline3\nline4")
+        press(widget, "3", "j")
+        assert widget.cursor_location == (3, 0)
+        assert not widget.count_handler.has_count()
+
+    def test_insert_after_motion(self, make_widget):
+        """Test A moves to the line end and enters insert mode."""
+        widget = make_widget("hello")
+        press(widget, "A")
+        assert widget.cursor_location == (0, 5)
+        assert widget.vim_mode == VimMode.INSERT
+
+    def test_operator_key_keeps_count(self, make_widget):
+        """Test d enters operator-pending mode with the typed count."""
+        widget = make_widget("a\nb\nc\nd")
+        press(widget, "2", "d")
+        assert widget.operator_pending.get_operator() == "d"
+        press(widget, "d")
+        assert widget.text == "c\nd"
+
+    def test_operator_motion_keys(self, make_widget):
+        """Test d followed by a motion key deletes over the motion."""
+        widget = make_widget("hello world", 0, 5)
+        press(widget, "d", "dollar")
+        assert widget.text == "hello"
+        assert not widget.operator_pending.is_pending()
+
+    def test_motion_count_after_operator(self, make_widget):
+        """Test digits after an operator count the motion (d2l)."""
+        widget = make_widget("hello")
+        press(widget, "d", "2", "l")
+        assert widget.text == "llo"
+        assert widget.yank_register == "he"
+
+    def test_pending_command_key(self, make_widget):
+        """Test f waits for a character, then searches for it."""
+        widget = make_widget("hello world")
+        press(widget, "f")
+        assert widget.pending_command == "f"
+        press(widget, "w")
+        assert widget.pending_command is None
+        assert widget.cursor_location == (0, 6)
+
+    def test_two_key_command(self, make_widget):
+        """Test gg jumps to the top of the document."""
+        widget = make_widget("line1\nline2\nline3", 2, 3)
+        press(widget, "g", "g")
+        assert widget.cursor_location == (0, 0)
+        assert widget.pending_command is None
+
+    def test_pending_char_command(self, make_widget):
+        """Test r replaces the character under the cursor with the next key."""
+        widget = make_widget("hello")
+        press(widget, "r", "j")
+        assert widget.text == "jello"
+
+    def test_unmatched_pending_key_cancels(self, make_widget):
+        """Test an unknown second key just clears the pending command."""
+        widget = make_widget("hello")
+        press(widget, "g", "z")
+        assert widget.pending_command is None
+        assert widget.cursor_location == (0, 0)
+
+    def test_unknown_key_not_consumed(self, make_widget):
+        """Test keys without a command fall through to the TextArea."""
+        widget = make_widget("hello")
+        event = press(widget, "z")
+        assert not event._no_default_action
+        assert widget.text == "hello"
+
+    def test_handler_reports_consumed_key(self, make_widget):
+        """Test the command-mode handler returns whether it used the key."""
+        widget = make_widget("hello")
+        assert widget._handle_command_mode("l") is True
+        assert widget.cursor_location == (0, 1)
+        assert widget._handle_command_mode("z") is False
+
+    def test_dispatch_tables_name_real_methods(self):
+        """Test every method named in a dispatch table exists on the widget."""
+        names = [
+            *VimTextArea._MODE_KEY_HANDLERS.values(),
+            *VimTextArea._OPERATOR_MOTIONS.values(),
+            *VimTextArea._PENDING_COMMANDS.values(),
+            *VimTextArea._PENDING_CHAR_COMMANDS.values(),
+        ]
+        missing = [name for name in names if not callable(getattr(VimTextArea, name, None))]
+        assert missing == []
+
+
+def test_submitted_stripped_text():
+    """Test Submitted strips its text once and keeps the raw text."""
+    message = VimTextArea.Submitted("  hello\n")
+    assert message.text == "  hello\n"
+    assert message.stripped_text == "hello"
+    assert message.stripped_text is message.stripped_text
+
+
+class TestVisualKeys:
+    """Test visual-mode key dispatch."""
+
+    def test_visual_delete_returns_to_command_mode(self, make_widget):
+        """Test d deletes the selection and leaves visual mode."""
+        widget = make_widget("hello")
+        press(widget, "v", "l", "d")
+        assert widget.vim_mode == VimMode.COMMAND
+        assert widget.yank_register == "h"
+        assert widget.text == "ello"
+
+    def test_visual_case_key_stays_in_visual_mode(self, make_widget):
+        """Test U uppercases the selection without leaving visual mode."""
+        widget = make_widget("hello")
+        press(widget, "v", "dollar", "U")
+        assert widget.vim_mode == VimMode.VISUAL
+        assert widget.text == "HELLo"
+        assert widget.selection == Selection((0, 0), (0, 4))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
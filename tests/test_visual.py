@@ -1,36 +1,30 @@
 """Tests for visual mode operations."""
 
 import pytest
-from vimkeys_input import VimTextArea, VimMode
+from textual.widgets.text_area import Selection, Location
+from vimkeys_input import VimMode
 
 
 class TestVisualModeEntry:
     """Test entering and exiting visual mode."""
 
-    def test_enter_visual_mode(self):
+    def test_enter_visual_mode(self, make_widget):
         """Test v enters visual mode."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("hello world")
 
         widget._enter_visual_mode()
         assert widget.vim_mode == VimMode.VISUAL
 
-    def test_visual_start_recorded(self):
+    def test_visual_start_recorded(self, make_widget):
         """Test visual mode records starting position."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.COMMAND
-        widget.cursor_location = (0, 5)
+        widget = make_widget("hello world", 0, 5)
 
         widget._enter_visual_mode()
         assert widget.visual_start == (0, 5)
 
-    def test_exit_visual_mode(self):
+    def test_exit_visual_mode(self, make_widget):
         """Test ESC exits visual mode."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("hello world", mode=VimMode.VISUAL)
 
         widget._enter_command_mode()
         assert widget.vim_mode == VimMode.COMMAND
@@ -40,40 +34,28 @@ class TestVisualModeEntry:
 class TestVisualNavigation:
     """Test navigation in visual mode extends selection."""
 
-    def test_visual_left(self):
+    def test_visual_left(self, make_widget):
         """Test h in visual mode extends selection left."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
-        widget.cursor_location = (0, 5)
+        widget = make_widget("hello world", 0, 5, mode=VimMode.VISUAL)
 
         # Should call action_cursor_left_select
         widget.visual_left()
 
-    def test_visual_right(self):
+    def test_visual_right(self, make_widget):
         """Test l in visual mode extends selection right."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
-        widget.cursor_location = (0, 5)
+        widget = make_widget("hello world", 0, 5, mode=VimMode.VISUAL)
 
         widget.visual_right()
 
-    def test_visual_down(self):
+    def test_visual_down(self, make_widget):
         """Test j in visual mode extends selection down."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.VISUAL
-        widget.cursor_location = (0, 0)
+        widget = make_widget("line1\nline2\nline3", mode=VimMode.VISUAL)
 
         widget.visual_down()
 
-    def test_visual_up(self):
+    def test_visual_up(self, make_widget):
         """Test k in visual mode extends selection up."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.VISUAL
-        widget.cursor_location = (1, 0)
+        widget = make_widget("line1\nline2\nline3", 1, 0, mode=VimMode.VISUAL)
 
         widget.visual_up()
 
@@ -81,21 +63,15 @@ class TestVisualNavigation:
 class TestVisualWordMotion:
     """Test word motions in visual mode."""
 
-    def test_visual_word_forward(self):
+    def test_visual_word_forward(self, make_widget):
         """Test w in visual mode."""
-        widget = VimTextArea()
-        widget.text = "hello world foo"
-        widget.vim_mode = VimMode.VISUAL
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello world foo", mode=VimMode.VISUAL)
 
         widget.visual_word_forward()
 
-    def test_visual_word_backward(self):
+    def test_visual_word_backward(self, make_widget):
         """Test b in visual mode."""
-        widget = VimTextArea()
-        widget.text = "hello world foo"
-        widget.vim_mode = VimMode.VISUAL
-        widget.cursor_location = (0, 12)
+        widget = make_widget("hello world foo", 0, 12, mode=VimMode.VISUAL)
 
         widget.visual_word_backward()
 
@@ -103,21 +79,15 @@ class TestVisualWordMotion:
 class TestVisualLineMotion:
     """Test line motions in visual mode."""
 
-    def test_visual_line_start(self):
+    def test_visual_line_start(self, make_widget):
         """Test 0 in visual mode."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
-        widget.cursor_location = (0, 5)
+        widget = make_widget("hello world", 0, 5, mode=VimMode.VISUAL)
 
         widget.visual_line_start()
 
-    def test_visual_line_end(self):
+    def test_visual_line_end(self, make_widget):
         """Test $ in visual mode."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
-        widget.cursor_location = (0, 0)
+        widget = make_widget("hello world", mode=VimMode.VISUAL)
 
         widget.visual_line_end()
 
@@ -125,41 +95,33 @@ class TestVisualLineMotion:
 class TestVisualOperations:
     """Test operations on visual selections."""
 
-    def test_visual_yank(self):
+    def test_visual_yank(self, make_widget):
         """Test y yanks selection."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("hello world", mode=VimMode.VISUAL)
         widget.selected_text = "hello"
 
         widget.visual_yank()
         assert widget.yank_register == "hello"
 
-    def test_visual_yank_empty_selection(self):
+    def test_visual_yank_empty_selection(self, make_widget):
         """Test y with no selection."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("hello world", mode=VimMode.VISUAL)
         widget.selected_text = ""
 
         widget.visual_yank()
         # Should not crash
 
-    def test_visual_delete(self):
+    def test_visual_delete(self, make_widget):
         """Test d deletes selection."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("hello world", mode=VimMode.VISUAL)
         widget.selected_text = "hello"
 
         widget.visual_delete()
         assert widget.yank_register == "hello"
 
-    def test_visual_change(self):
+    def test_visual_change(self, make_widget):
         """Test c changes selection and enters insert mode."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("hello world", mode=VimMode.VISUAL)
         widget.selected_text = "hello"
 
         widget.visual_change()
@@ -169,83 +131,128 @@ class TestVisualOperations:
 class TestVisualIndent:
     """Test indent/dedent in visual mode."""
 
-    def test_visual_indent(self):
+    def test_visual_indent(self, make_widget):
         """Test > indents selection."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("line1\nline2\nline3", mode=VimMode.VISUAL)
 
         # Create a mock selection
-        from textual.widgets.text_area import Selection, Location
-
         widget.selection = Selection(start=Location(0, 0), end=Location(1, 5))
 
         # Should not crash
         widget.visual_indent()
 
-    def test_visual_dedent(self):
+    def test_visual_dedent(self, make_widget):
         """Test < dedents selection."""
-        widget = VimTextArea()
-        widget.text = "    line1\n    line2"
-        widget.vim_mode = VimMode.VISUAL
-
-        from textual.widgets.text_area import Selection, Location
+        widget = make_widget("    line1\n    line2", mode=VimMode.VISUAL)
 
         widget.selection = Selection(start=Location(0, 0), end=Location(1, 5))
 
         # Should not crash
         widget.visual_dedent()
 
+    def test_visual_indent_dedent_lines(self, make_widget):
+        """Test > and < shift every selected line by up to 4 spaces."""
+        widget = make_widget("a\n b\n      c\nd", mode=VimMode.VISUAL)
+        widget.selection = Selection((0, 0), (2, 2))
+
+        widget.visual_dedent()
+        assert widget.text == "a\nb\n  c\nd"
+
+        widget.visual_indent()
+        assert widget.text == "    a\n    b\n      c\nd"
+
+    def test_visual_indent_dedent_upward_selection(self, make_widget):
+        """Test > and < cover the same rows when the selection runs upward."""
+        widget = make_widget("a\nb\nc\nd", mode=VimMode.VISUAL)
+        widget.selection = Selection((2, 1), (1, 0))
+
+        widget.visual_indent()
+        assert widget.text == "a\n    b\n    c\nd"
+
+        widget.visual_dedent()
+        assert widget.text == "a\nb\nc\nd"
+
+    def test_visual_dedent_short_indent(self, make_widget):
+        """Test < strips lines indented by fewer than 4 spaces completely."""
+        widget = make_widget(" a\n  b\n   c\n\td", mode=VimMode.VISUAL)
+        widget.selection = Selection((0, 0), (3, 1))
+
+        widget.visual_dedent()
+        assert widget.text == "a\nb\nc\n\td"
+
+    def test_visual_dedent_mixed_blank_lines(self, make_widget):
+        """Test < leaves blank lines in a block alone and keeps deeper indents."""
+        widget = make_widget("x\n        a\n\n    b\n  \nc", mode=VimMode.VISUAL)
+        widget.selection = Selection((1, 0), (4, 2))
+
+        widget.visual_dedent()
+        assert widget.text == "x\n    a\n\nb\n\nc"
+
 
 class TestVisualCaseOperations:
     """Test case manipulation in visual mode."""
 
-    def test_visual_toggle_case(self):
+    def test_visual_toggle_case(self, make_widget):
         """Test ~ toggles case."""
-        widget = VimTextArea()
-        widget.text = "Hello World"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("Hello World", mode=VimMode.VISUAL)
         widget.selected_text = "Hello"
 
         widget.visual_toggle_case()
         # Textual will handle the actual replacement
 
-    def test_visual_uppercase(self):
+    def test_visual_uppercase(self, make_widget):
         """Test U converts to uppercase."""
-        widget = VimTextArea()
-        widget.text = "hello world"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("hello world", mode=VimMode.VISUAL)
         widget.selected_text = "hello"
 
         widget.visual_uppercase()
 
-    def test_visual_lowercase(self):
+    def test_visual_lowercase(self, make_widget):
         """Test u converts to lowercase."""
-        widget = VimTextArea()
-        widget.text = "HELLO WORLD"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("HELLO WORLD", mode=VimMode.VISUAL)
         widget.selected_text = "HELLO"
 
         widget.visual_lowercase()
 
+    def test_visual_case_multiline_keeps_selection(self, make_widget):
+        """Test U and ~ change a multi-line selection and leave it selected."""
+        widget = make_widget("hello world\nfoo bar", mode=VimMode.VISUAL)
+        widget.selection = Selection((0, 6), (1, 3))
+
+        widget.visual_uppercase()
+        assert widget.text == "hello WORLD\nFOO bar"
+        assert widget.selection == Selection((0, 6), (1, 3))
+        assert widget.cursor_location == (1, 3)
+
+        widget.visual_toggle_case()
+        assert widget.text == "hello world\nfoo bar"
+        assert widget.selection == Selection((0, 6), (1, 3))
+        assert widget.cursor_location == (1, 3)
+
+    def test_visual_lowercase_upward_multiline(self, make_widget):
+        """Test u on an upward multi-line selection keeps its direction and cursor."""
+        widget = make_widget("HELLO WORLD\nFOO BAR", mode=VimMode.VISUAL)
+        widget.selection = Selection((1, 3), (0, 6))
+
+        widget.visual_lowercase()
+        assert widget.text == "HELLO world\nfoo BAR"
+        assert widget.selection == Selection((1, 3), (0, 6))
+        assert widget.cursor_location == (0, 6)
+
 
 class TestVisualEdgeCases:
     """Test edge cases in visual mode."""
 
-    def test_visual_on_empty_text(self):
+    def test_visual_on_empty_text(self, make_widget):
         """Test visual mode on empty text."""
-        widget = VimTextArea()
-        widget.text = ""
-        widget.vim_mode = VimMode.COMMAND
+        widget = make_widget("")
 
         widget._enter_visual_mode()
         assert widget.vim_mode == VimMode.VISUAL
 
-    def test_visual_operations_no_selection(self):
+    def test_visual_operations_no_selection(self, make_widget):
         """Test operations with no selection."""
-        widget = VimTextArea()
-        widget.text = "hello"
-        widget.vim_mode = VimMode.VISUAL
+        widget = make_widget("hello", mode=VimMode.VISUAL)
         widget.selected_text = ""
 
         # Should not crash
@@ -255,12 +262,9 @@ class TestVisualEdgeCases:
         widget.visual_uppercase()
         widget.visual_lowercase()
 
-    def test_visual_multiline_selection(self):
+    def test_visual_multiline_selection(self, make_widget):
         """Test visual mode across multiple lines."""
-        widget = VimTextArea()
-        widget.text = "line1\nline2\nline3"
-        widget.vim_mode = VimMode.VISUAL
-        widget.cursor_location = (0, 0)
+        widget = make_widget("line1\nline2\nline3", mode=VimMode.VISUAL)
 
         # Extend selection down
         widget.visual_down()
@@ -1,7 +1,21 @@
 """Textual VimKeys Input - Vim keybindings for Textual TextArea widgets."""
 
+from typing import TYPE_CHECKING
+
 from .vim_modes import VimMode
-from .vim_textarea import VimTextArea
+
+if TYPE_CHECKING:
+    from .vim_textarea import VimTextArea
 
 __all__ = ["VimMode", "VimTextArea"]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    """Import VimTextArea (and with it Textual) on first access."""
+    if name == "VimTextArea":
+        from .vim_textarea import VimTextArea
+
+        globals()["VimTextArea"] = VimTextArea
+        return VimTextArea
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
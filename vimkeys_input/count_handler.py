@@ -15,9 +15,15 @@ class CountHandler:
         10G - go to line 10
     """
 
+    __slots__ = ("count",)
+
     def __init__(self):
         self.count = 0
-        self.count_str = ""
+
+    @property
+    def count_str(self) -> str:
+        """The digits typed so far (empty if no count)."""
+        return str(self.count) if self.count else ""
 
     def add_digit(self, digit: str) -> None:
         """Add a digit to the current count.
@@ -25,15 +31,14 @@ class CountHandler:
         Args:
             digit: Single digit character ('0'-'9')
         """
-        if not digit.isdigit():
+        if len(digit) != 1 or not "0" <= digit <= "9":
             return
 
         # Special case: leading 0 is not allowed (would be line start command)
-        if digit == "0" and self.count_str == "":
+        if digit == "0" and self.count == 0:
             return
 
-        self.count_str += digit
-        self.count = int(self.count_str)
+        self.count = self.count * 10 + (ord(digit) - 48)
 
     def get_count(self, default: int = 1) -> int:
         """Get the current count, or default if no count entered.
@@ -59,7 +64,6 @@ class CountHandler:
     def clear(self) -> None:
         """Clear the current count."""
         self.count = 0
-        self.count_str = ""
 
     def __str__(self) -> str:
         """String representation for display.
@@ -7,33 +7,35 @@ Examples:
     - `a: jump to exact position of mark 'a'
 """
 
-from typing import Dict, Tuple, Optional
+import string
+
+# Valid mark names (a-z, A-Z)
+_MARK_NAMES = frozenset(string.ascii_letters)
 
 
 class MarksManager:
     """Manages vim marks (bookmarks in the document)."""
 
+    __slots__ = ("marks",)
+
     def __init__(self):
         # Dict of mark_name -> (row, col)
-        self.marks: Dict[str, Tuple[int, int]] = {}
+        self.marks: dict[str, tuple[int, int]] = {}
 
-    def set_mark(self, name: str, position: Tuple[int, int]) -> None:
+    def set_mark(self, name: str, position: tuple[int, int]) -> None:
         """Set a mark at the given position.
 
         Args:
             name: Single character mark name (a-z, A-Z)
             position: (row, col) tuple
         """
-        if len(name) != 1:
-            return
-
-        # Only allow letter marks
-        if not name.isalpha():
+        # Only allow single letter marks
+        if name not in _MARK_NAMES:
             return
 
         self.marks[name] = position
 
-    def get_mark(self, name: str) -> Optional[Tuple[int, int]]:
+    def get_mark(self, name: str) -> tuple[int, int] | None:
         """Get the position of a mark.
 
         Args:
@@ -61,14 +63,13 @@ class MarksManager:
         Args:
             name: Single character mark name
         """
-        if name in self.marks:
-            del self.marks[name]
+        self.marks.pop(name, None)
 
     def clear_all(self) -> None:
         """Clear all marks."""
         self.marks.clear()
 
-    def list_marks(self) -> Dict[str, Tuple[int, int]]:
+    def list_marks(self) -> dict[str, tuple[int, int]]:
         """Get all marks.
 
         Returns:
@@ -32,7 +32,7 @@ class EditingMixin:
     def edit_delete_line(self) -> None:
         """Delete current line (dd)."""
         row, col = self.cursor_location
-        line_text = str(str(self.get_line(row)))
+        line_text = self.document.get_line(row)
 
         # Save to yank register
         self.yank_register = line_text
@@ -43,13 +43,13 @@ class EditingMixin:
     def edit_yank_line(self) -> None:
         """Yank (copy) current line (yy)."""
         row, col = self.cursor_location
-        line_text = str(str(self.get_line(row)))
+        line_text = self.document.get_line(row)
         self.yank_register = line_text
 
     def edit_delete_to_line_end(self) -> None:
         """Delete from cursor to end of line (D)."""
         row, col = self.cursor_location
-        line = str(str(self.get_line(row)))
+        line = self.document.get_line(row)
 
         # Save deleted text to yank register
         self.yank_register = line[col:]
@@ -60,7 +60,7 @@ class EditingMixin:
     def edit_delete_to_line_start(self) -> None:
         """Delete from cursor to start of line."""
         row, col = self.cursor_location
-        line = str(str(self.get_line(row)))
+        line = self.document.get_line(row)
 
         # Save deleted text to yank register
         self.yank_register = line[:col]
@@ -82,9 +82,11 @@ class EditingMixin:
 
         # Check if we yanked a full line (ends with newline)
         if self.yank_register.endswith("\n"):
-            # Paste line below current line
-            self.action_cursor_line_end()
-            self.insert("\n" + self.yank_register.rstrip("\n"))
+            # Paste line below current line, leaving the cursor at its start
+            row, _ = self.cursor_location
+            line_end = (row, len(self.document.get_line(row)))
+            self.insert("\n" + self.yank_register.rstrip("\n"), line_end)
+            self.cursor_location = (row + 1, 0)
         else:
             # Paste after cursor
             self.action_cursor_right()
@@ -97,10 +99,10 @@ class EditingMixin:
 
         # Check if we yanked a full line
         if self.yank_register.endswith("\n"):
-            # Paste line above current line
-            self.action_cursor_line_start()
-            self.insert(self.yank_register)
-            self.action_cursor_up()
+            # Paste line above current line, leaving the cursor at its start
+            row, _ = self.cursor_location
+            self.insert(self.yank_register, (row, 0))
+            self.cursor_location = (row, 0)
         else:
             # Paste before cursor
             self.insert(self.yank_register)
@@ -132,14 +134,13 @@ class EditingMixin:
 
         # If on same line, delete the range
         if start_row == end_row:
-            line = str(str(self.get_line(start_row)))
+            line = self.document.get_line(start_row)
             deleted = line[start_col:end_col]
             self.yank_register = deleted
 
-            # Move back and delete
+            # Move back and delete the range as a single edit
             self.cursor_location = (start_row, start_col)
-            for _ in range(end_col - start_col):
-                self.action_delete_right()
+            self.delete((start_row, start_col), (end_row, end_col))
 
     def edit_change_word(self) -> None:
         """Change word (cw)."""
@@ -168,16 +169,13 @@ class EditingMixin:
             return
 
         # Get current and next line
-        current_line = str(str(self.get_line(row)))
-        next_line = str(str(self.get_line(row + 1)))
-
-        # Delete next line
-        self.cursor_location = (row + 1, 0)
-        self.action_delete_line()
+        current_line = self.document.get_line(row)
+        next_line = self.document.get_line(row + 1)
 
-        # Add space and next line content to current line
-        self.cursor_location = (row, len(current_line))
-        self.insert(" " + next_line.lstrip())
+        # Replace the line break and next line's indent with a single space
+        join_at = (row, len(current_line))
+        self.replace(" " + next_line.lstrip(), join_at, (row + 1, len(next_line)))
+        self.cursor_location = join_at
 
     # === INDENT ===
 
@@ -1,6 +1,11 @@
 """Navigation operations for vim mode."""
 
 
+def _is_blank(line: str) -> bool:
+    """Check if a line is empty or whitespace only."""
+    return not line or line.isspace()
+
+
 class NavigationMixin:
     """Mixin providing vim navigation operations."""
 
@@ -34,13 +39,14 @@ class NavigationMixin:
 
     def nav_word_end(self) -> None:
         """Move to end of current/next word (e)."""
-        # TextArea doesn't have word_end action, so approximate
-        self.action_cursor_word_right()
-        # Move back one if we're not at line end
-        row, col = self.cursor_location
-        line = str(str(self.get_line(row)))
-        if col > 0 and col < len(line):
-            self.action_cursor_left()
+        # TextArea doesn't have word_end action, so approximate: the word-right
+        # target, back one column unless that lands at a line edge
+        if not self.show_cursor or self.cursor_at_end_of_text:
+            return
+        row, col = self.get_cursor_word_right_location()
+        if 0 < col < len(self.document.get_line(row)):
+            col -= 1
+        self.move_cursor((row, col))
 
     # === LINE NAVIGATION ===
 
@@ -55,13 +61,13 @@ class NavigationMixin:
     def nav_first_non_whitespace(self) -> None:
         """Move to first non-whitespace character (^)."""
         row, _ = self.cursor_location
-        line = str(str(self.get_line(row)))
+        line = self.document.get_line(row)
 
         # Find first non-whitespace character
-        for i, char in enumerate(line):
-            if not char.isspace():
-                self.cursor_location = (row, i)
-                return
+        stripped = line.lstrip()
+        if stripped:
+            self.cursor_location = (row, len(line) - len(stripped))
+            return
 
         # If all whitespace or empty, go to line start
         self.action_cursor_line_start()
@@ -91,18 +97,18 @@ class NavigationMixin:
     def nav_paragraph_forward(self) -> None:
         """Move to next paragraph ({)."""
         row, col = self.cursor_location
-        line_count = self.document.line_count
-
-        # Find next blank line
-        found_text = False
-        for i in range(row + 1, line_count):
-            line = str(self.get_line(i)).strip()
-            if line:
-                found_text = True
-            elif found_text:
-                # Found blank line after text
-                self.cursor_location = (i, 0)
-                return
+        lines = self.document.lines
+        line_count = len(lines)
+
+        # Skip blank lines to the next text, then find the blank line after it
+        i = row + 1
+        while i < line_count and _is_blank(lines[i]):
+            i += 1
+        while i < line_count and not _is_blank(lines[i]):
+            i += 1
+        if i < line_count:
+            self.cursor_location = (i, 0)
+            return
 
         # If no blank line found, go to end
         self.nav_document_end()
@@ -110,17 +116,17 @@ class NavigationMixin:
     def nav_paragraph_backward(self) -> None:
         """Move to previous paragraph (})."""
         row, col = self.cursor_location
-
-        # Find previous blank line
-        found_text = False
-        for i in range(row - 1, -1, -1):
-            line = str(self.get_line(i)).strip()
-            if line:
-                found_text = True
-            elif found_text:
-                # Found blank line after text (going backwards)
-                self.cursor_location = (i, 0)
-                return
+        lines = self.document.lines
+
+        # Same as forward, going backwards
+        i = row - 1
+        while i >= 0 and _is_blank(lines[i]):
+            i -= 1
+        while i >= 0 and not _is_blank(lines[i]):
+            i -= 1
+        if i >= 0:
+            self.cursor_location = (i, 0)
+            return
 
         # If no blank line found, go to start
         self.nav_document_start()
@@ -1,5 +1,44 @@
 """Character search operations for vim mode."""
 
+import re
+
+# A run of alphanumeric characters (\w without the underscore, matching str.isalnum)
+_WORD_RUN = re.compile(r"[^\W_]+")
+
+# Search method that repeats (;) or reverses (,) each kind of f/F/t/T search
+_REPEAT_SEARCH = {
+    "f": "search_char_forward",
+    "F": "search_char_backward",
+    "t": "search_till_forward",
+    "T": "search_till_backward",
+}
+_REVERSE_SEARCH = {
+    "f": "search_char_backward",
+    "F": "search_char_forward",
+    "t": "search_till_backward",
+    "T": "search_till_forward",
+}
+
+
+def _find_in_rows(
+    lines: list[str], word: str, first: int, last: int, reverse: bool = False
+) -> tuple[int, int] | None:
+    """Find word in lines[first:last] with a single scan over the joined rows.
+
+    Returns:
+        (row, col) of the first match (last match if reverse), or None
+    """
+    if first >= last:
+        return None
+    # Words never contain newlines, so a match can't straddle two rows
+    block = "\n".join(lines[first:last])
+    idx = block.rfind(word) if reverse else block.find(word)
+    if idx == -1:
+        return None
+    row = first + block.count("\n", 0, idx)
+    col = idx - (block.rfind("\n", 0, idx) + 1)
+    return (row, col)
+
 
 class SearchMixin:
     """Mixin providing character search operations."""
@@ -16,17 +55,15 @@ class SearchMixin:
             True if character was found, False otherwise
         """
         row, col = self.cursor_location
-        line = str(str(self.get_line(row)))
 
         # Search for character after cursor
-        if col + 1 < len(line):
-            idx = line.find(char, col + 1)
-            if idx != -1:
-                self.cursor_location = (row, idx)
-                self.last_f_search = ("f", char)
-                return True
+        idx = self.document.get_line(row).find(char, col + 1)
+        if idx == -1:
+            return False
 
-        return False
+        self.cursor_location = (row, idx)
+        self.last_f_search = ("f", char)
+        return True
 
     def search_char_backward(self, char: str) -> bool:
         """Find character backward on current line (F{char}).
@@ -38,17 +75,15 @@ class SearchMixin:
             True if character was found, False otherwise
         """
         row, col = self.cursor_location
-        line = str(str(self.get_line(row)))
 
         # Search for character before cursor
-        if col > 0:
-            idx = line.rfind(char, 0, col)
-            if idx != -1:
-                self.cursor_location = (row, idx)
-                self.last_f_search = ("F", char)
-                return True
+        idx = self.document.get_line(row).rfind(char, 0, col)
+        if idx == -1:
+            return False
 
-        return False
+        self.cursor_location = (row, idx)
+        self.last_f_search = ("F", char)
+        return True
 
     def search_till_forward(self, char: str) -> bool:
         """Move till (before) character forward (t{char}).
@@ -61,19 +96,14 @@ class SearchMixin:
         """
         row, col = self.cursor_location
 
-        # Find the character
-        if self.search_char_forward(char):
-            # Move back one to stop before it
-            _, new_col = self.cursor_location
-            if new_col > col:  # Make sure we actually moved
-                self.action_cursor_left()
-                self.last_f_search = ("t", char)
-                return True
-            else:
-                # Restore position if we didn't move
-                self.cursor_location = (row, col)
+        # Find the character, then stop one before it
+        idx = self.document.get_line(row).find(char, col + 1)
+        if idx == -1:
+            return False
 
-        return False
+        self.cursor_location = (row, idx - 1)
+        self.last_f_search = ("t", char)
+        return True
 
     def search_till_backward(self, char: str) -> bool:
         """Move till (after) character backward (T{char}).
@@ -86,19 +116,14 @@ class SearchMixin:
         """
         row, col = self.cursor_location
 
-        # Find the character
-        if self.search_char_backward(char):
-            # Move forward one to stop after it
-            _, new_col = self.cursor_location
-            if new_col < col:  # Make sure we actually moved
-                self.action_cursor_right()
-                self.last_f_search = ("T", char)
-                return True
-            else:
-                # Restore position if we didn't move
-                self.cursor_location = (row, col)
+        # Find the character, then stop one after it
+        idx = self.document.get_line(row).rfind(char, 0, col)
+        if idx == -1:
+            return False
 
-        return False
+        self.cursor_location = (row, idx + 1)
+        self.last_f_search = ("T", char)
+        return True
 
     def search_repeat(self) -> bool:
         """Repeat last f/t search (;).
@@ -110,17 +135,10 @@ class SearchMixin:
             return False
 
         search_type, char = self.last_f_search
-
-        if search_type == "f":
-            return self.search_char_forward(char)
-        elif search_type == "F":
-            return self.search_char_backward(char)
-        elif search_type == "t":
-            return self.search_till_forward(char)
-        elif search_type == "T":
-            return self.search_till_backward(char)
-
-        return False
+        method = _REPEAT_SEARCH.get(search_type)
+        if method is None:
+            return False
+        return getattr(self, method)(char)
 
     def search_repeat_reverse(self) -> bool:
         """Repeat last f/t search in opposite direction (,).
@@ -132,18 +150,10 @@ class SearchMixin:
             return False
 
         search_type, char = self.last_f_search
-
-        # Reverse the direction
-        if search_type == "f":
-            return self.search_char_backward(char)
-        elif search_type == "F":
-            return self.search_char_forward(char)
-        elif search_type == "t":
-            return self.search_till_backward(char)
-        elif search_type == "T":
-            return self.search_till_forward(char)
-
-        return False
+        method = _REVERSE_SEARCH.get(search_type)
+        if method is None:
+            return False
+        return getattr(self, method)(char)
 
     # === WORD SEARCH ===
 
@@ -157,24 +167,18 @@ class SearchMixin:
             True if word was found, False otherwise
         """
         row, col = self.cursor_location
-        line = str(str(self.get_line(row)))
+        line = self.document.get_line(row)
 
         # Get word under cursor
         if col >= len(line) or not line[col].isalnum():
             return False
 
-        # Find word boundaries
-        start = col
-        while start > 0 and line[start - 1].isalnum():
-            start -= 1
-
-        end = col
-        while end < len(line) and line[end].isalnum():
-            end += 1
-
-        word = line[start:end]
-        if not word:
-            return False
+        # Find word boundaries: the first alphanumeric run ending past the cursor holds it
+        for match in _WORD_RUN.finditer(line):
+            if match.end() > col:
+                break
+        start, end = match.span()
+        word = match.group()
 
         # Store word for future searches
         self.last_search_word = word
@@ -187,57 +191,40 @@ class SearchMixin:
 
     def _search_word_forward(self, word: str, start_row: int, start_col: int) -> bool:
         """Helper to search for word forward from position."""
-        line_count = self.document.line_count
+        lines = self.document.lines
 
         # Search current line first (from start_col)
-        line = str(self.get_line(start_row))[start_col:]
-        idx = line.find(word)
+        idx = lines[start_row].find(word, start_col)
         if idx != -1:
-            self.cursor_location = (start_row, start_col + idx)
+            self.cursor_location = (start_row, idx)
             return True
 
-        # Search following lines
-        for row in range(start_row + 1, line_count):
-            line = str(str(self.get_line(row)))
-            idx = line.find(word)
-            if idx != -1:
-                self.cursor_location = (row, idx)
-                return True
-
-        # Wrap around to beginning
-        for row in range(0, start_row):
-            line = str(str(self.get_line(row)))
-            idx = line.find(word)
-            if idx != -1:
-                self.cursor_location = (row, idx)
-                return True
+        # Search following lines, then wrap around to beginning
+        found = _find_in_rows(lines, word, start_row + 1, len(lines)) or _find_in_rows(
+            lines, word, 0, start_row
+        )
+        if found:
+            self.cursor_location = found
+            return True
 
         return False
 
     def _search_word_backward(self, word: str, start_row: int, start_col: int) -> bool:
         """Helper to search for word backward from position."""
+        lines = self.document.lines
+
         # Search current line first (up to start_col)
-        line = str(self.get_line(start_row))[:start_col]
-        idx = line.rfind(word)
+        idx = lines[start_row].rfind(word, 0, start_col)
         if idx != -1:
             self.cursor_location = (start_row, idx)
             return True
 
-        # Search previous lines
-        for row in range(start_row - 1, -1, -1):
-            line = str(str(self.get_line(row)))
-            idx = line.rfind(word)
-            if idx != -1:
-                self.cursor_location = (row, idx)
-                return True
-
-        # Wrap around to end
-        line_count = self.document.line_count
-        for row in range(line_count - 1, start_row, -1):
-            line = str(str(self.get_line(row)))
-            idx = line.rfind(word)
-            if idx != -1:
-                self.cursor_location = (row, idx)
-                return True
+        # Search previous lines, then wrap around to end
+        found = _find_in_rows(lines, word, 0, start_row, reverse=True) or _find_in_rows(
+            lines, word, start_row + 1, len(lines), reverse=True
+        )
+        if found:
+            self.cursor_location = found
+            return True
 
         return False
@@ -8,8 +8,62 @@ Examples:
     - yi{: yank inside braces
 """
 
+import re
+from bisect import bisect_right
 from typing import Tuple, Optional
 
+from .search import _WORD_RUN
+
+# Whitespace after a word, taken along by aw (always matches, possibly empty)
+_SPACE_RUN = re.compile(r"\s*")
+
+# A quote is escaped only by an odd number of backslashes before it
+_UNESCAPED_QUOTE = {quote: re.compile(r"(?<!\\)(?:\\\\)*" + re.escape(quote)) for quote in "\"'`"}
+
+# (open, close) pair for every bracket character, whichever side was typed
+_BRACKET_ENDS = {
+    char: (open_char, close_char)
+    for open_char, close_char in ("()", "[]", "{}", "<>")
+    for char in (open_char, close_char)
+}
+
+
+def _find_open_bracket(line: str, col: int, open_char: str, close_char: str) -> int | None:
+    """Find the unmatched open bracket at or before col.
+
+    Jumps between bracket characters with rfind rather than visiting every column.
+    """
+    depth = 0
+    open_pos = line.rfind(open_char, 0, col + 1)
+    close_pos = line.rfind(close_char, 0, col + 1)
+    while open_pos != -1:
+        if close_pos > open_pos:
+            depth += 1
+            close_pos = line.rfind(close_char, 0, close_pos)
+        elif depth == 0:
+            return open_pos
+        else:
+            depth -= 1
+            open_pos = line.rfind(open_char, 0, open_pos)
+    return None
+
+
+def _find_close_bracket(line: str, col: int, open_char: str, close_char: str) -> int | None:
+    """Find the unmatched close bracket at or after col (mirror of _find_open_bracket)."""
+    depth = 0
+    open_pos = line.find(open_char, col)
+    close_pos = line.find(close_char, col)
+    while close_pos != -1:
+        if open_pos != -1 and open_pos < close_pos:
+            depth += 1
+            open_pos = line.find(open_char, open_pos + 1)
+        elif depth == 0:
+            return close_pos
+        else:
+            depth -= 1
+            close_pos = line.find(close_char, close_pos + 1)
+    return None
+
 
 class TextObjectMixin:
     """Mixin providing text object operations."""
@@ -27,7 +81,7 @@ class TextObjectMixin:
     }
 
     # Quote characters
-    QUOTE_CHARS = {'"', "'", "`"}
+    QUOTE_CHARS = frozenset("\"'`")
 
     def get_text_object(
         self, obj_type: str, obj_char: str, inner: bool = True
@@ -63,27 +117,25 @@ class TextObjectMixin:
             (start_pos, end_pos) or None
         """
         row, col = self.cursor_location
-        line = str(self.get_line(row))
+        line = self.document.get_line(row)
 
         if col >= len(line):
             return None
 
-        # Find word boundaries
+        # Expand left to word start, matching the line backwards from the cursor
         start = col
-        end = col
-
-        # Expand left to word start
-        while start > 0 and line[start - 1].isalnum():
-            start -= 1
+        if col > 0:
+            left = _WORD_RUN.match(line[col - 1 :: -1])
+            if left:
+                start -= left.end()
 
         # Expand right to word end
-        while end < len(line) and line[end].isalnum():
-            end += 1
+        right = _WORD_RUN.match(line, col)
+        end = right.end() if right else col
 
         # For 'around word' (aw), include trailing whitespace
         if not inner:
-            while end < len(line) and line[end].isspace():
-                end += 1
+            end = _SPACE_RUN.match(line, end).end()
 
         if start == end:
             return None
@@ -103,46 +155,18 @@ class TextObjectMixin:
             (start_pos, end_pos) or None
         """
         # Determine opening and closing brackets
-        if bracket in "([{<":
-            open_char = bracket
-            close_char = self.BRACKET_PAIRS[bracket]
-        else:
-            close_char = bracket
-            open_char = self.BRACKET_PAIRS[bracket]
+        open_char, close_char = _BRACKET_ENDS[bracket]
 
         row, col = self.cursor_location
-        line = str(self.get_line(row))
+        line = self.document.get_line(row)
 
         # Find the enclosing brackets
         # This is a simplified implementation - real vim does multiline
-        open_pos = None
-        close_pos = None
-        depth = 0
-
-        # Search backward for opening bracket
-        for i in range(col, -1, -1):
-            if line[i] == close_char:
-                depth += 1
-            elif line[i] == open_char:
-                if depth == 0:
-                    open_pos = i
-                    break
-                depth -= 1
-
+        open_pos = _find_open_bracket(line, col, open_char, close_char)
         if open_pos is None:
             return None
 
-        # Search forward for closing bracket
-        depth = 0
-        for i in range(col, len(line)):
-            if line[i] == open_char:
-                depth += 1
-            elif line[i] == close_char:
-                if depth == 0:
-                    close_pos = i
-                    break
-                depth -= 1
-
+        close_pos = _find_close_bracket(line, col, open_char, close_char)
         if close_pos is None:
             return None
 
@@ -165,34 +189,15 @@ class TextObjectMixin:
             (start_pos, end_pos) or None
         """
         row, col = self.cursor_location
-        line = str(self.get_line(row))
-
-        # Find the enclosing quotes
-        # Search backward for opening quote
-        open_pos = None
-        for i in range(col, -1, -1):
-            if line[i] == quote:
-                # Check if it's escaped
-                if i > 0 and line[i - 1] == "\\":
-                    continue
-                open_pos = i
-                break
+        line = self.document.get_line(row)
 
-        if open_pos is None:
-            return None
-
-        # Search forward for closing quote
-        close_pos = None
-        for i in range(open_pos + 1, len(line)):
-            if line[i] == quote:
-                # Check if it's escaped
-                if line[i - 1] == "\\":
-                    continue
-                close_pos = i
-                break
-
-        if close_pos is None:
+        # The last unescaped quote at or before the cursor opens the string,
+        # the next one closes it
+        positions = [m.end() - 1 for m in _UNESCAPED_QUOTE[quote].finditer(line)]
+        index = bisect_right(positions, col) - 1
+        if index < 0 or index + 1 >= len(positions):
             return None
+        open_pos, close_pos = positions[index], positions[index + 1]
 
         # Return based on inner/around
         if inner:
@@ -225,14 +230,13 @@ class TextObjectMixin:
 
         if start_row == end_row:
             # Same line - delete the range
-            line = str(self.get_line(start_row))
+            line = self.document.get_line(start_row)
             deleted = line[start_col:end_col]
             self.yank_register = deleted
 
-            # Position cursor and delete characters
+            # Position cursor and delete the range as a single edit
             self.cursor_location = start_pos
-            for _ in range(end_col - start_col):
-                self.action_delete_right()
+            self.delete(start_pos, end_pos)
             return True
 
         return False
@@ -273,7 +277,7 @@ class TextObjectMixin:
         end_row, end_col = end_pos
 
         if start_row == end_row:
-            line = str(self.get_line(start_row))
+            line = self.document.get_line(start_row)
             self.yank_register = line[start_col:end_col]
             return True
 
@@ -1,7 +1,14 @@
 """Visual mode operations for vim."""
 
+import re
+from collections.abc import Callable
+
 from textual.widgets.text_area import Selection
 
+# Indent added by > and removed (up to this many spaces) by <
+_INDENT = "    "
+_LEADING_INDENT = re.compile(r"^ {1,4}", re.MULTILINE)
+
 
 class VisualMixin:
     """Mixin providing visual mode operations."""
@@ -14,7 +21,7 @@ class VisualMixin:
         TextArea selections are exclusive at the end (like Python slices),
         but vim visual mode is inclusive. This extends the end position by 1.
         """
-        line = str(self.get_line(row))
+        line = self.document.get_line(row)
         # Don't extend past the line end
         if col < len(line):
             return (row, col + 1)
@@ -22,17 +29,19 @@ class VisualMixin:
 
     def _extend_selection(self, new_row: int, new_col: int) -> None:
         """Extend selection to a new cursor position."""
-        if self.selection.start == self.selection.end:
-            # No selection yet, start from current cursor
-            start = self.cursor_location
-        else:
-            # Keep the selection start, extend the end
-            start = self.selection.start
-
-        # Make the selection inclusive (vim behavior)
+        # The anchor is the selection start (the cursor itself when nothing is
+        # selected yet). Keep it unless the inclusive (vim) end would collapse
+        # the selection, and move the cursor in a single selection update.
         inclusive_end = self._make_inclusive_end(new_row, new_col)
-        self.selection = Selection(start=start, end=inclusive_end)
-        self.cursor_location = (new_row, new_col)
+        self.move_cursor((new_row, new_col), select=inclusive_end != self.selection.start)
+
+    def _extend_via_nav(self, nav: Callable[[], None]) -> None:
+        """Run a navigation command and extend the selection to where it lands."""
+        # Navigation clears the selection, so save its anchor first
+        anchor = self.selection.start
+        nav()
+        new_row, new_col = self.cursor_location
+        self.selection = Selection(start=anchor, end=self._make_inclusive_end(new_row, new_col))
 
     def visual_left(self) -> None:
         """Extend selection left (h in visual mode)."""
@@ -55,54 +64,21 @@ class VisualMixin:
     def visual_right(self) -> None:
         """Extend selection right (l in visual mode)."""
         row, col = self.cursor_location
-        line = str(self.get_line(row))
+        line = self.document.get_line(row)
         if col < len(line):
             self._extend_selection(row, col + 1)
 
     def visual_word_forward(self) -> None:
         """Extend selection to next word (w in visual mode)."""
-        # Save selection start before navigation (which clears selection)
-        selection_start = (
-            self.selection.start
-            if self.selection.start != self.selection.end
-            else self.cursor_location
-        )
-        # Use navigation to find next word
-        self.nav_word_forward()
-        # Restore and extend selection to new position (inclusive)
-        new_row, new_col = self.cursor_location
-        inclusive_end = self._make_inclusive_end(new_row, new_col)
-        self.selection = Selection(start=selection_start, end=inclusive_end)
+        self._extend_via_nav(self.nav_word_forward)
 
     def visual_word_backward(self) -> None:
         """Extend selection to previous word (b in visual mode)."""
-        # Save selection start before navigation (which clears selection)
-        selection_start = (
-            self.selection.start
-            if self.selection.start != self.selection.end
-            else self.cursor_location
-        )
-        # Use navigation to find previous word
-        self.nav_word_backward()
-        # Restore and extend selection to new position (inclusive)
-        new_row, new_col = self.cursor_location
-        inclusive_end = self._make_inclusive_end(new_row, new_col)
-        self.selection = Selection(start=selection_start, end=inclusive_end)
+        self._extend_via_nav(self.nav_word_backward)
 
     def visual_word_end(self) -> None:
         """Extend selection to end of word (e in visual mode)."""
-        # Save selection start before navigation (which clears selection)
-        selection_start = (
-            self.selection.start
-            if self.selection.start != self.selection.end
-            else self.cursor_location
-        )
-        # Use navigation to find word end
-        self.nav_word_end()
-        # Restore and extend selection to new position (inclusive)
-        new_row, new_col = self.cursor_location
-        inclusive_end = self._make_inclusive_end(new_row, new_col)
-        self.selection = Selection(start=selection_start, end=inclusive_end)
+        self._extend_via_nav(self.nav_word_end)
 
     def visual_line_start(self) -> None:
         """Extend selection to line start (0 in visual mode)."""
@@ -115,7 +91,7 @@ class VisualMixin:
         """Extend selection to line end ($ in visual mode)."""
         # Get current position
         row, _ = self.cursor_location
-        line = str(self.get_line(row))
+        line = self.document.get_line(row)
         # Position cursor at last character of line (or 0 if empty)
         last_col = max(0, len(line) - 1) if len(line) > 0 else 0
         # Extend selection to end of line (inclusive)
@@ -123,33 +99,11 @@ class VisualMixin:
 
     def visual_document_start(self) -> None:
         """Extend selection to document start (gg in visual mode)."""
-        # Save selection start before navigation (which clears selection)
-        selection_start = (
-            self.selection.start
-            if self.selection.start != self.selection.end
-            else self.cursor_location
-        )
-        # Navigate to document start
-        self.nav_document_start()
-        # Restore and extend selection to new position (inclusive)
-        new_row, new_col = self.cursor_location
-        inclusive_end = self._make_inclusive_end(new_row, new_col)
-        self.selection = Selection(start=selection_start, end=inclusive_end)
+        self._extend_via_nav(self.nav_document_start)
 
     def visual_document_end(self) -> None:
         """Extend selection to document end (G in visual mode)."""
-        # Save selection start before navigation (which clears selection)
-        selection_start = (
-            self.selection.start
-            if self.selection.start != self.selection.end
-            else self.cursor_location
-        )
-        # Navigate to document end
-        self.nav_document_end()
-        # Restore and extend selection to new position (inclusive)
-        new_row, new_col = self.cursor_location
-        inclusive_end = self._make_inclusive_end(new_row, new_col)
-        self.selection = Selection(start=selection_start, end=inclusive_end)
+        self._extend_via_nav(self.nav_document_end)
 
     # === VISUAL MODE OPERATIONS ===
 
@@ -179,11 +133,10 @@ class VisualMixin:
         start_row = min(self.selection.start[0], self.selection.end[0])
         end_row = max(self.selection.start[0], self.selection.end[0])
 
-        # Indent each line in selection
-        for row in range(start_row, end_row + 1):
-            line = str(self.get_line(row))
-            # Add 4 spaces at start of line
-            self.replace("    " + line, (row, 0), (row, len(line)))
+        # Add 4 spaces at the start of each line, as one edit over the block
+        lines = self.document.lines[start_row : end_row + 1]
+        indented = _INDENT + ("\n" + _INDENT).join(lines)
+        self.replace(indented, (start_row, 0), (end_row, len(lines[-1])))
 
     def visual_dedent(self) -> None:
         """Dedent selected lines (< in visual mode)."""
@@ -194,39 +147,35 @@ class VisualMixin:
         start_row = min(self.selection.start[0], self.selection.end[0])
         end_row = max(self.selection.start[0], self.selection.end[0])
 
-        # Dedent each line in selection
-        for row in range(start_row, end_row + 1):
-            line = str(self.get_line(row))
-            # Remove up to 4 leading spaces
-            dedented = line[4:] if line.startswith("    ") else line.lstrip(" ", 1)
-            self.replace(dedented, (row, 0), (row, len(line)))
+        # Remove up to 4 leading spaces from each line, as one edit over the block
+        lines = self.document.lines[start_row : end_row + 1]
+        dedented = _LEADING_INDENT.sub("", "\n".join(lines))
+        self.replace(dedented, (start_row, 0), (end_row, len(lines[-1])))
 
     def visual_toggle_case(self) -> None:
         """Toggle case of selected text (~)."""
-        if not self.selected_text:
+        text = self.selected_text
+        if not text:
             return
 
-        # Toggle case
-        toggled = self.selected_text.swapcase()
-
-        # Replace selection
-        self.action_delete()
-        self.insert(toggled)
+        # Replace the selection in a single edit
+        start, end = self.selection
+        self.replace(text.swapcase(), start, end)
 
     def visual_uppercase(self) -> None:
         """Convert selected text to uppercase (U in visual mode)."""
-        if not self.selected_text:
+        text = self.selected_text
+        if not text:
             return
 
-        uppercased = self.selected_text.upper()
-        self.action_delete()
-        self.insert(uppercased)
+        start, end = self.selection
+        self.replace(text.upper(), start, end)
 
     def visual_lowercase(self) -> None:
         """Convert selected text to lowercase (u in visual mode)."""
-        if not self.selected_text:
+        text = self.selected_text
+        if not text:
             return
 
-        lowercased = self.selected_text.lower()
-        self.action_delete()
-        self.insert(lowercased)
+        start, end = self.selection
+        self.replace(text.lower(), start, end)
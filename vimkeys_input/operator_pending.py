@@ -23,6 +23,8 @@ class OperatorPendingState:
     and wait for a motion to complete the command.
     """
 
+    __slots__ = ("count", "motion_count", "operator")
+
     def __init__(self):
         self.operator: Optional[str] = None  # Current operator (d, c, y, >, <)
         self.count: int = 0  # Count before operator (3d)
@@ -70,14 +72,8 @@ class OperatorPendingState:
         Returns:
             Total count, minimum 1
         """
-        if self.count > 0 and self.motion_count > 0:
-            return self.count * self.motion_count
-        elif self.count > 0:
-            return self.count
-        elif self.motion_count > 0:
-            return self.motion_count
-        else:
-            return 1
+        # A missing count (0) counts as 1 on either side
+        return (self.count or 1) * (self.motion_count or 1)
 
     def set_motion_count(self, count: int) -> None:
         """Set the count entered after the operator.
@@ -146,21 +142,19 @@ class OperatorMotionHandler:
             if start_col > end_col:
                 start_col, end_col = end_col, start_col
 
-            line = str(widget.get_line(start_row))
+            line = widget.document.get_line(start_row)
             affected_text = line[start_col:end_col]
 
             if operator == "d":  # Delete
                 widget.yank_register = affected_text
                 widget.cursor_location = (start_row, start_col)
-                for _ in range(end_col - start_col):
-                    widget.action_delete_right()
+                widget.delete((start_row, start_col), (start_row, end_col))
                 return True
 
             elif operator == "c":  # Change (delete + insert mode)
                 widget.yank_register = affected_text
                 widget.cursor_location = (start_row, start_col)
-                for _ in range(end_col - start_col):
-                    widget.action_delete_right()
+                widget.delete((start_row, start_col), (start_row, end_col))
                 widget._enter_insert_mode()
                 return True
 
@@ -192,10 +186,7 @@ class OperatorMotionHandler:
         elif operator == "y":
             # For multiple lines, yank them all
             row, col = widget.cursor_location
-            lines = []
-            for i in range(count):
-                if row + i < widget.document.line_count:
-                    lines.append(str(widget.get_line(row + i)))
+            lines = widget.document.lines[row : row + count]
             widget.yank_register = "\n".join(lines) + "\n"
             return True
         elif operator == "c":
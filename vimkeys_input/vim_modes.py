@@ -12,25 +12,31 @@ class VimMode(Enum):
     VISUAL_LINE = "VISUAL_LINE"  # For future
 
 
+# Status text and CSS class for each mode
+_MODE_DISPLAY = {
+    VimMode.INSERT: "-- INSERT --",
+    VimMode.COMMAND: "",  # Command mode shows nothing (vim default)
+    VimMode.VISUAL: "-- VISUAL --",
+    VimMode.VISUAL_LINE: "-- VISUAL LINE --",
+}
+
+_MODE_BORDER = {
+    VimMode.INSERT: "insert-mode",
+    VimMode.COMMAND: "command-mode",
+    VimMode.VISUAL: "visual-mode",
+    VimMode.VISUAL_LINE: "visual-line-mode",
+}
+
+
 class ModeIndicator:
     """Helper for mode display."""
 
     @staticmethod
     def get_display(mode: VimMode) -> str:
         """Get display string for mode."""
-        return {
-            VimMode.INSERT: "-- INSERT --",
-            VimMode.COMMAND: "",  # Command mode shows nothing (vim default)
-            VimMode.VISUAL: "-- VISUAL --",
-            VimMode.VISUAL_LINE: "-- VISUAL LINE --",
-        }[mode]
+        return _MODE_DISPLAY[mode]
 
     @staticmethod
     def get_border_style(mode: VimMode) -> str:
         """Get CSS class for mode."""
-        return {
-            VimMode.INSERT: "insert-mode",
-            VimMode.COMMAND: "command-mode",
-            VimMode.VISUAL: "visual-mode",
-            VimMode.VISUAL_LINE: "visual-line-mode",
-        }[mode]
+        return _MODE_BORDER[mode]
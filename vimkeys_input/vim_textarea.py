@@ -4,6 +4,10 @@ This module provides the main VimTextArea widget that combines all vim operation
 through mixins for better code organization.
 """
 
+from collections.abc import Callable, Mapping
+from functools import cached_property
+from types import MappingProxyType
+
 from textual.widgets import TextArea
 from textual.message import Message
 from textual.reactive import reactive
@@ -66,6 +70,14 @@ class VimTextArea(
             super().__init__()
             self.text = text
 
+        @cached_property
+        def stripped_text(self) -> str:
+            """The submitted text without surrounding whitespace.
+
+            Stripped once per message, however many handlers it bubbles to.
+            """
+            return self.text.strip()
+
     class ModeChanged(Message):
         """Posted when vim mode changes."""
 
@@ -77,6 +89,9 @@ class VimTextArea(
         super().__init__(*args, **kwargs)
 
         # Vim state
+        self._mode_class = None  # Mode CSS class currently applied
+        # First set of the reactive runs watch_vim_mode, which routes keys and
+        # applies the initial mode class
         self.vim_mode = VimMode.INSERT
         self.visual_start = None  # For visual mode
         self.pending_command = None  # For dd, yy, gg, etc.
@@ -90,45 +105,67 @@ class VimTextArea(
         self.text_object_state = None  # For pending text object operations (d + i + w)
         self.operator_pending = OperatorPendingState()  # For operator + motion (dw, c$, y3w)
 
-        # Initialize CSS class
+    def watch_vim_mode(self, mode: VimMode) -> None:
+        """Restyle and announce the mode whenever it changes."""
+        self._route_keys(mode)
         self._update_mode_display()
 
     def _update_mode_display(self):
         """Update CSS class and emit mode change event."""
-        # Remove all mode classes
-        self.remove_class("insert-mode", "command-mode", "visual-mode")
+        mode_class = ModeIndicator.get_border_style(self.vim_mode)
+
+        # Nothing to restyle or announce if the mode's class is already applied
+        # (e.g. escape pressed while already in command mode)
+        if mode_class == self._mode_class:
+            return
 
-        # Add current mode class
-        self.add_class(ModeIndicator.get_border_style(self.vim_mode))
+        # Swap only the previous mode's class for the current one
+        if self._mode_class is not None:
+            self.remove_class(self._mode_class)
+        self.add_class(mode_class)
+        self._mode_class = mode_class
 
         # Post mode change event
         self.post_message(self.ModeChanged(self.vim_mode))
 
     # === KEY EVENT ROUTING ===
 
+    # Key handler for each mode, by method name; modes without one (VISUAL_LINE,
+    # not implemented yet) leave keys to the TextArea
+    _MODE_KEY_HANDLERS: Mapping[VimMode, str] = MappingProxyType(
+        {
+            VimMode.INSERT: "_handle_insert_mode",
+            VimMode.COMMAND: "_handle_command_mode",
+            VimMode.VISUAL: "_handle_visual_mode",
+        }
+    )
+
+    def _route_keys(self, mode: VimMode) -> None:
+        """Pick the key handler for a mode, once per mode change rather than per key."""
+        name = self._MODE_KEY_HANDLERS.get(mode)
+        self._key_handler = getattr(self, name) if name else None
+
     def on_key(self, event):
         """Main key event handler - routes based on vim mode."""
+        key = event.key
 
         # ESC always goes to command mode
-        if event.key == "escape":
+        if key == "escape":
             self._enter_command_mode()
             event.prevent_default()
             return
 
-        # Route to mode-specific handler
-        if self.vim_mode == VimMode.INSERT:
-            self._handle_insert_mode(event)
-        elif self.vim_mode == VimMode.COMMAND:
-            self._handle_command_mode(event)
-        elif self.vim_mode == VimMode.VISUAL:
-            self._handle_visual_mode(event)
+        # Route to mode-specific handler; it returns True when it consumed the
+        # key, which is the one place the TextArea's default action is stopped
+        key_handler = self._key_handler
+        if key_handler is not None and key_handler(key):
+            event.prevent_default()
 
     # === MODE TRANSITIONS ===
 
     def _enter_insert_mode(self):
         """Enter insert mode."""
         self.vim_mode = VimMode.INSERT
-        self._update_mode_display()
 
     def _enter_command_mode(self):
         """Enter command mode."""
@@ -137,286 +174,200 @@ class VimTextArea(
         self.pending_command = None
         self.count_handler.clear()  # Clear any pending count
         self.text_object_state = None  # Clear text object state
-        self._update_mode_display()
 
     def _enter_visual_mode(self):
         """Enter visual mode."""
         self.vim_mode = VimMode.VISUAL
         self.visual_start = self.cursor_location
-        self._update_mode_display()
 
     # === INSERT MODE ===
 
-    def _handle_insert_mode(self, event):
-        """Handle keys in insert mode."""
+    def _handle_insert_mode(self, key: str) -> bool:
+        """Handle keys in insert mode.
+
+        Returns:
+            True if the key was consumed
+        """
         # Enter submits (can be customized)
-        if event.key == "enter":
-            text = self.text
-            self.clear()
+        if key == "enter":
+            # clear() already extracts the removed text (for undo), so take the
+            # submitted text from it instead of building self.text a second time
+            text = self.clear().replaced_text
             self.post_message(self.Submitted(text))
-            event.prevent_default()
-            return
+            return True
 
         # Everything else: default TextArea behavior
         # (typing, backspace, arrows, etc.)
+        return False
 
     # === COMMAND MODE ===
 
-    def _handle_command_mode(self, event):
-        """Handle keys in command mode."""
-        key = event.key
+    def _handle_command_mode(self, key: str) -> bool:
+        """Handle keys in command mode.
+
+        Returns:
+            True if the key was consumed
+        """
+        operator_pending = self.operator_pending
 
         # Handle number input for counts (5j, 3dd, etc.)
-        if key.isdigit():
+        if len(key) == 1 and "0" <= key <= "9":
             # If we're in operator-pending mode, this is motion count (d3w)
-            if self.operator_pending.is_pending():
-                self.operator_pending.set_motion_count(
-                    self.operator_pending.motion_count * 10 + int(key)
-                )
+            if operator_pending.is_pending():
+                operator_pending.set_motion_count(operator_pending.motion_count * 10 + int(key))
             else:
                 self.count_handler.add_digit(key)
-            event.prevent_default()
-            return
+            return True
 
         # Handle operator-pending mode (dw, c$, y3j, etc.)
-        if self.operator_pending.is_pending():
-            if self._handle_operator_motion(event):
-                event.prevent_default()
-                return
+        if operator_pending.is_pending():
+            if self._handle_operator_motion(key):
+                return True
 
         # Handle pending commands first (dd, yy, gg, etc.)
         if self.pending_command:
-            self._handle_pending_command(event)
-            event.prevent_default()
-            return
-
-        # === NAVIGATION ===
-
-        # Basic movement (hjkl) - with count support
-        if key == "h":
-            count = self.count_handler.get_count()
-            for _ in range(count):
-                self.nav_left()
-            self.count_handler.clear()
-            event.prevent_default()
-        elif key == "j":
-            count = self.count_handler.get_count()
-            for _ in range(count):
-                self.nav_down()
-            self.count_handler.clear()
-            event.prevent_default()
-        elif key == "k":
-            count = self.count_handler.get_count()
-            for _ in range(count):
-                self.nav_up()
-            self.count_handler.clear()
-            event.prevent_default()
-        elif key == "l":
-            count = self.count_handler.get_count()
-            for _ in range(count):
-                self.nav_right()
-            self.count_handler.clear()
-            event.prevent_default()
-
-        # Word movement - with count support
-        elif key == "w":
-            count = self.count_handler.get_count()
-            for _ in range(count):
-                self.nav_word_forward()
-            self.count_handler.clear()
-            event.prevent_default()
-        elif key == "b":
-            count = self.count_handler.get_count()
-            for _ in range(count):
-                self.nav_word_backward()
-            self.count_handler.clear()
-            event.prevent_default()
-        elif key == "e":
-            count = self.count_handler.get_count()
-            for _ in range(count):
-                self.nav_word_end()
-            self.count_handler.clear()
-            event.prevent_default()
-
-        # Line movement
-        elif key == "0":
-            self.nav_line_start()
-            event.prevent_default()
-        elif key == "dollar":  # $
-            self.nav_line_end()
-            event.prevent_default()
-        elif key == "circumflex":  # ^
-            self.nav_first_non_whitespace()
-            event.prevent_default()
-
-        # Document movement
-        elif key == "g":
-            self.pending_command = "g"
-            event.prevent_default()
-        elif key == "G":  # Shift+g
-            self.nav_document_end()
-            event.prevent_default()
-
-        # Page movement
-        elif key == "ctrl+d":
-            self.nav_page_down()
-            event.prevent_default()
-        elif key == "ctrl+u":
-            self.nav_page_up()
-            event.prevent_default()
-
-        # Paragraph movement
-        elif key == "braceleft":  # {
-            self.nav_paragraph_backward()
-            event.prevent_default()
-        elif key == "braceright":  # }
-            self.nav_paragraph_forward()
-            event.prevent_default()
-
-        # === MODE CHANGES ===
-
-        # Enter insert mode
-        elif key == "i":
-            self._enter_insert_mode()
-            event.prevent_default()
-        elif key == "I":  # Insert at line start
-            self.nav_line_start()
-            self._enter_insert_mode()
-            event.prevent_default()
-        elif key == "a":
-            self.nav_right()
-            self._enter_insert_mode()
-            event.prevent_default()
-        elif key == "A":  # Append at line end
-            self.nav_line_end()
-            self._enter_insert_mode()
-            event.prevent_default()
-        elif key == "o":  # Open line below
-            self.edit_open_line_below()
-            self._enter_insert_mode()
-            event.prevent_default()
-        elif key == "O":  # Open line above
-            self.edit_open_line_above()
-            self._enter_insert_mode()
-            event.prevent_default()
-
-        # Enter visual mode
-        elif key == "v":
-            self._enter_visual_mode()
-            event.prevent_default()
-
-        # === EDITING ===
-
-        # Delete character
-        elif key == "x":
-            self.edit_delete_char()
-            event.prevent_default()
-        elif key == "X":  # Delete left
-            self.edit_delete_char_back()
-            event.prevent_default()
-
-        # Delete/change/yank - enter operator-pending mode
-        elif key == "d":
-            count = self.count_handler.get_count(0)  # 0 means no count
-            self.operator_pending.set_operator("d", count)
-            self.count_handler.clear()
-            event.prevent_default()
-        elif key == "D":
-            self.edit_delete_to_line_end()
-            event.prevent_default()
-        elif key == "c":
-            count = self.count_handler.get_count(0)
-            self.operator_pending.set_operator("c", count)
-            self.count_handler.clear()
-            event.prevent_default()
-        elif key == "C":
-            self.edit_delete_to_line_end()
-            self._enter_insert_mode()
-            event.prevent_default()
-
-        # Yank - enter operator-pending mode
-        elif key == "y":
-            count = self.count_handler.get_count(0)
-            self.operator_pending.set_operator("y", count)
-            self.count_handler.clear()
-            event.prevent_default()
-
-        # Paste
-        elif key == "p":
-            self.edit_paste_after()
-            event.prevent_default()
-        elif key == "P":  # Paste before
-            self.edit_paste_before()
-            event.prevent_default()
-
-        # Replace character (r)
-        elif key == "r":
-            self.pending_command = "r"
-            event.prevent_default()
-
-        # Join lines (J)
-        elif key == "J":
-            self.edit_join_lines()
-            event.prevent_default()
-
-        # Indent/dedent
-        elif key == "greater_than":  # >
-            self.pending_command = ">"
-            event.prevent_default()
-        elif key == "less_than":  # <
-            self.pending_command = "<"
-            event.prevent_default()
-
-        # Undo/redo
-        elif key == "u":
-            self.edit_undo()
-            event.prevent_default()
-        elif key == "ctrl+r":
-            self.edit_redo()
-            event.prevent_default()
-
-        # === SEARCH ===
-
-        # Find character (f/F/t/T)
-        elif key == "f":
-            self.pending_command = "f"
-            event.prevent_default()
-        elif key == "F":
-            self.pending_command = "F"
-            event.prevent_default()
-        elif key == "t":
-            self.pending_command = "t"
-            event.prevent_default()
-        elif key == "T":
-            self.pending_command = "T"
-            event.prevent_default()
+            self._handle_pending_command(key)
+            return True
 
-        # Repeat search
-        elif key == "semicolon":  # ;
-            self.search_repeat()
-            event.prevent_default()
-        elif key == "comma":  # ,
-            self.search_repeat_reverse()
-            event.prevent_default()
+        # Single-key commands: one table lookup instead of an elif chain
+        handler = self._COMMAND_KEYS.get(key)
+        if handler is None:
+            return False
+        handler(self)
+        return True
+
+    def _repeat_motion(self, motion: Callable[[], None]) -> None:
+        """Run a motion count times (5j, 3w) and consume the count."""
+        count_handler = self.count_handler
+        count = count_handler.count
+        if not count:
+            # No count typed: the common single motion, nothing to clear
+            motion()
+            return
 
-        # Word search
-        elif key == "asterisk":  # *
-            self.search_word_under_cursor(forward=True)
-            event.prevent_default()
-        elif key == "numbersign":  # #
-            self.search_word_under_cursor(forward=False)
-            event.prevent_default()
+        for _ in range(count):
+            motion()
+        count_handler.clear()
+
+    def _start_operator(self, operator: str) -> None:
+        """Enter operator-pending mode for d/c/y, keeping any count (3dw)."""
+        count_handler = self.count_handler
+        count = count_handler.count  # 0 means no count
+        self.operator_pending.set_operator(operator, count)
+        if count:
+            count_handler.clear()
+
+    def _start_pending(self, command: str) -> None:
+        """Wait for the second key of a multi-key command (gg, r{char}, f{char})."""
+        self.pending_command = command
+
+    def _then_insert(self, action: Callable[[], None]) -> None:
+        """Run an action and enter insert mode (I, a, A, o, O, C)."""
+        action()
+        self._enter_insert_mode()
+
+    # Command-mode single-key commands, looked up once per keystroke.
+    # Each handler takes the widget. Built once at import and read-only, since
+    # every widget shares it.
+    _COMMAND_KEYS: Mapping[str, Callable[["VimTextArea"], None]] = MappingProxyType(
+        {
+            # === NAVIGATION ===
+            # Basic movement (hjkl) - with count support
+            "h": lambda s: s._repeat_motion(s.nav_left),
+            "j": lambda s: s._repeat_motion(s.nav_down),
+            "k": lambda s: s._repeat_motion(s.nav_up),
+            "l": lambda s: s._repeat_motion(s.nav_right),
+            # Word movement - with count support
+            "w": lambda s: s._repeat_motion(s.nav_word_forward),
+            "b": lambda s: s._repeat_motion(s.nav_word_backward),
+            "e": lambda s: s._repeat_motion(s.nav_word_end),
+            # Line movement
+            "0": lambda s: s.nav_line_start(),
+            "dollar": lambda s: s.nav_line_end(),  # $
+            "circumflex": lambda s: s.nav_first_non_whitespace(),  # ^
+            # Document movement
+            "g": lambda s: s._start_pending("g"),
+            "G": lambda s: s.nav_document_end(),  # Shift+g
+            # Page movement
+            "ctrl+d": lambda s: s.nav_page_down(),
+            "ctrl+u": lambda s: s.nav_page_up(),
+            # Paragraph movement
+            "braceleft": lambda s: s.nav_paragraph_backward(),  # {
+            "braceright": lambda s: s.nav_paragraph_forward(),  # }
+            # === MODE CHANGES ===
+            # Enter insert mode
+            "i": lambda s: s._enter_insert_mode(),
+            "I": lambda s: s._then_insert(s.nav_line_start),  # Insert at line start
+            "a": lambda s: s._then_insert(s.nav_right),
+            "A": lambda s: s._then_insert(s.nav_line_end),  # Append at line end
+            "o": lambda s: s._then_insert(s.edit_open_line_below),  # Open line below
+            "O": lambda s: s._then_insert(s.edit_open_line_above),  # Open line above
+            # Enter visual mode
+            "v": lambda s: s._enter_visual_mode(),
+            # === EDITING ===
+            # Delete character
+            "x": lambda s: s.edit_delete_char(),
+            "X": lambda s: s.edit_delete_char_back(),  # Delete left
+            # Delete/change/yank - enter operator-pending mode
+            "d": lambda s: s._start_operator("d"),
+            "D": lambda s: s.edit_delete_to_line_end(),
+            "c": lambda s: s._start_operator("c"),
+            "C": lambda s: s._then_insert(s.edit_delete_to_line_end),
+            "y": lambda s: s._start_operator("y"),
+            # Paste
+            "p": lambda s: s.edit_paste_after(),
+            "P": lambda s: s.edit_paste_before(),  # Paste before
+            # Replace character (r)
+            "r": lambda s: s._start_pending("r"),
+            # Join lines (J)
+            "J": lambda s: s.edit_join_lines(),
+            # Indent/dedent
+            "greater_than": lambda s: s._start_pending(">"),  # >
+            "less_than": lambda s: s._start_pending("<"),  # <
+            # Undo/redo
+            "u": lambda s: s.edit_undo(),
+            "ctrl+r": lambda s: s.edit_redo(),
+            # === SEARCH ===
+            # Find character (f/F/t/T)
+            "f": lambda s: s._start_pending("f"),
+            "F": lambda s: s._start_pending("F"),
+            "t": lambda s: s._start_pending("t"),
+            "T": lambda s: s._start_pending("T"),
+            # Repeat search
+            "semicolon": lambda s: s.search_repeat(),  # ;
+            "comma": lambda s: s.search_repeat_reverse(),  # ,
+            # Word search
+            "asterisk": lambda s: s.search_word_under_cursor(forward=True),  # *
+            "numbersign": lambda s: s.search_word_under_cursor(forward=False),  # #
+        }
+    )
+
+    # Motions accepted after an operator (dw, c$, y3j), as method names since
+    # the bound methods belong to each widget
+    _OPERATOR_MOTIONS: Mapping[str, str] = MappingProxyType(
+        {
+            "h": "nav_left",
+            "j": "nav_down",
+            "k": "nav_up",
+            "l": "nav_right",
+            "w": "nav_word_forward",
+            "b": "nav_word_backward",
+            "e": "nav_word_end",
+            "0": "nav_line_start",
+            "dollar": "nav_line_end",  # $
+            "circumflex": "nav_first_non_whitespace",  # ^
+        }
+    )
 
-    def _handle_operator_motion(self, event) -> bool:
+    def _handle_operator_motion(self, key: str) -> bool:
         """Handle motion key when in operator-pending mode.
 
         Args:
-            event: Key event
+            key: Key name
 
         Returns:
             True if motion was handled
         """
-        key = event.key
         operator = self.operator_pending.get_operator()
 
         # Handle same operator (dd, yy, cc) - line-wise operation
@@ -426,24 +377,11 @@ class VimTextArea(
             self.operator_pending.clear()
             return success
 
-        # Map keys to motion functions
-        motion_map = {
-            "h": self.nav_left,
-            "j": self.nav_down,
-            "k": self.nav_up,
-            "l": self.nav_right,
-            "w": self.nav_word_forward,
-            "b": self.nav_word_backward,
-            "e": self.nav_word_end,
-            "0": self.nav_line_start,
-            "dollar": self.nav_line_end,  # $
-            "circumflex": self.nav_first_non_whitespace,  # ^
-        }
-
-        if key in motion_map:
+        motion = self._OPERATOR_MOTIONS.get(key)
+        if motion is not None:
             count = self.operator_pending.get_total_count()
             success = OperatorMotionHandler.execute_operator_motion(
-                self, operator, motion_map[key], count
+                self, operator, getattr(self, motion), count
             )
             self.operator_pending.clear()
             return success
@@ -455,155 +393,106 @@ class VimTextArea(
 
         return False
 
-    def _handle_pending_command(self, event):
+    # Two-key commands, by (pending command, second key)
+    _PENDING_COMMANDS: Mapping[tuple[str, str], str] = MappingProxyType(
+        {
+            ("d", "d"): "edit_delete_line",  # dd - delete line
+            ("d", "w"): "edit_delete_word",  # dw - delete word
+            ("y", "y"): "edit_yank_line",  # yy - yank line
+            ("c", "c"): "edit_change_line",  # cc - change line
+            ("c", "w"): "edit_change_word",  # cw - change word
+            ("g", "g"): "nav_document_start",  # gg - go to top
+            (">", "greater_than"): "edit_indent",  # >> - indent
+            ("<", "less_than"): "edit_dedent",  # << - dedent
+        }
+    )
+
+    # Pending commands whose second key is a character argument
+    _PENDING_CHAR_COMMANDS: Mapping[str, str] = MappingProxyType(
+        {
+            "r": "edit_replace_char",  # r{char} - replace character
+            "f": "search_char_forward",  # f{char} - find character forward
+            "F": "search_char_backward",  # F{char} - find character backward
+            "t": "search_till_forward",  # t{char} - till character forward
+            "T": "search_till_backward",  # T{char} - till character backward
+        }
+    )
+
+    def _handle_pending_command(self, key: str) -> None:
         """Handle second key of multi-key commands (dd, yy, gg, etc.)."""
-        key = event.key
         pending = self.pending_command
 
-        # dd - delete line
-        if pending == "d" and key == "d":
-            self.edit_delete_line()
-
-        # dw - delete word
-        elif pending == "d" and key == "w":
-            self.edit_delete_word()
-
-        # yy - yank line
-        elif pending == "y" and key == "y":
-            self.edit_yank_line()
-
-        # cc - change line
-        elif pending == "c" and key == "c":
-            self.edit_change_line()
-
-        # cw - change word
-        elif pending == "c" and key == "w":
-            self.edit_change_word()
-
-        # gg - go to top
-        elif pending == "g" and key == "g":
-            self.nav_document_start()
-
-        # >> - indent
-        elif pending == ">" and key == "greater_than":
-            self.edit_indent()
-
-        # << - dedent
-        elif pending == "<" and key == "less_than":
-            self.edit_dedent()
-
-        # r{char} - replace character
-        elif pending == "r":
-            self.edit_replace_char(key)
-
-        # f{char} - find character forward
-        elif pending == "f":
-            self.search_char_forward(key)
-
-        # F{char} - find character backward
-        elif pending == "F":
-            self.search_char_backward(key)
-
-        # t{char} - till character forward
-        elif pending == "t":
-            self.search_till_forward(key)
-
-        # T{char} - till character backward
-        elif pending == "T":
-            self.search_till_backward(key)
+        command = self._PENDING_COMMANDS.get((pending, key))
+        if command is not None:
+            getattr(self, command)()
+        else:
+            command = self._PENDING_CHAR_COMMANDS.get(pending)
+            if command is not None:
+                getattr(self, command)(key)
 
         # Clear pending command
         self.pending_command = None
 
     # === VISUAL MODE ===
 
-    def _handle_visual_mode(self, event):
-        """Handle keys in visual mode."""
-        key = event.key
+    def _handle_visual_mode(self, key: str) -> bool:
+        """Handle keys in visual mode.
 
+        Returns:
+            True if the key was consumed
+        """
         # Handle pending commands first (gg, etc.)
         if self.pending_command:
             if self.pending_command == "g" and key == "g":
                 self.visual_document_start()
                 self.pending_command = None
-                event.prevent_default()
-                return
+                return True
             # Clear pending if we got something unexpected
             self.pending_command = None
 
-        # Navigation extends selection
-        if key == "h":
-            self.visual_left()
-            event.prevent_default()
-        elif key == "j":
-            self.visual_down()
-            event.prevent_default()
-        elif key == "k":
-            self.visual_up()
-            event.prevent_default()
-        elif key == "l":
-            self.visual_right()
-            event.prevent_default()
-
-        # Word movement with selection
-        elif key == "w":
-            self.visual_word_forward()
-            event.prevent_default()
-        elif key == "b":
-            self.visual_word_backward()
-            event.prevent_default()
-        elif key == "e":
-            self.visual_word_end()
-            event.prevent_default()
-
-        # Line movement with selection
-        elif key == "0":
-            self.visual_line_start()
-            event.prevent_default()
-        elif key == "dollar":  # $
-            self.visual_line_end()
-            event.prevent_default()
-
-        # Document movement with selection
-        elif key == "g":
-            self.pending_command = "g"
-            event.prevent_default()
-        elif key == "G":
-            self.visual_document_end()
-            event.prevent_default()
-
-        # Yank selection
-        elif key == "y":
-            self.visual_yank()
-            self._enter_command_mode()
-            event.prevent_default()
-
-        # Delete selection
-        elif key == "d" or key == "x":
-            self.visual_delete()
-            self._enter_command_mode()
-            event.prevent_default()
-
-        # Change selection
-        elif key == "c":
-            self.visual_change()
-            event.prevent_default()
-
-        # Indent/dedent selection
-        elif key == "greater_than":  # >
-            self.visual_indent()
-            event.prevent_default()
-        elif key == "less_than":  # <
-            self.visual_dedent()
-            event.prevent_default()
-
-        # Case operations
-        elif key == "tilde":  # ~
-            self.visual_toggle_case()
-            event.prevent_default()
-        elif key == "u":
-            self.visual_lowercase()
-            event.prevent_default()
-        elif key == "U":
-            self.visual_uppercase()
-            event.prevent_default()
+        # Single-key commands: one table lookup instead of an elif chain
+        handler = self._VISUAL_KEYS.get(key)
+        if handler is None:
+            return False
+        handler(self)
+        return True
+
+    def _then_command_mode(self, action: Callable[[], None]) -> None:
+        """Run an action on the selection and leave visual mode (y, d, x)."""
+        action()
+        self._enter_command_mode()
+
+    # Visual-mode single-key commands, built once at import and shared read-only
+    _VISUAL_KEYS: Mapping[str, Callable[["VimTextArea"], None]] = MappingProxyType(
+        {
+            # Navigation extends selection
+            "h": lambda s: s.visual_left(),
+            "j": lambda s: s.visual_down(),
+            "k": lambda s: s.visual_up(),
+            "l": lambda s: s.visual_right(),
+            # Word movement with selection
+            "w": lambda s: s.visual_word_forward(),
+            "b": lambda s: s.visual_word_backward(),
+            "e": lambda s: s.visual_word_end(),
+            # Line movement with selection
+            "0": lambda s: s.visual_line_start(),
+            "dollar": lambda s: s.visual_line_end(),  # $
+            # Document movement with selection
+            "g": lambda s: s._start_pending("g"),
+            "G": lambda s: s.visual_document_end(),
+            # Yank selection
+            "y": lambda s: s._then_command_mode(s.visual_yank),
+            # Delete selection
+            "d": lambda s: s._then_command_mode(s.visual_delete),
+            "x": lambda s: s._then_command_mode(s.visual_delete),
+            # Change selection
+            "c": lambda s: s.visual_change(),
+            # Indent/dedent selection
+            "greater_than": lambda s: s.visual_indent(),  # >
+            "less_than": lambda s: s.visual_dedent(),  # <
+            # Case operations
+            "tilde": lambda s: s.visual_toggle_case(),  # ~
+            "u": lambda s: s.visual_lowercase(),
+            "U": lambda s: s.visual_uppercase(),
+        }
+    )